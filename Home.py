@@ -2,79 +2,34 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+from pathlib import Path
+from typing import Any, Dict
 
 import streamlit as st
 
 from components.data_loader import load_data
+from components.sidebar import render_sidebar_filters
+
+STYLE_PATH = Path("assets") / "style.css"
 
 st.set_page_config(page_title="LCK Analytics", layout="wide")
 
-# Apply custom CSS for improved visual hierarchy
-st.markdown("""
-<style>
-    /* Improve header and subheader styling */
-    h1 {
-        margin-bottom: 0.5rem;
-        font-weight: 600;
-    }
-    
-    h2 {
-        margin-top: 1rem;
-        margin-bottom: 0.5rem;
-        font-weight: 500;
-        font-size: 1.5rem;
-    }
-    
-    h3 {
-        margin-top: 0.75rem;
-        margin-bottom: 0.5rem;
-        font-weight: 500;
-        font-size: 1.2rem;
-    }
-    
-    /* Improve spacing for captions */
-    .stCaption {
-        margin-bottom: 1rem;
-    }
-    
-    /* Improve metric card spacing */
-    [data-testid="stMetricValue"] {
-        font-size: 2rem;
-    }
-    
-    /* Improve container spacing */
-    .stContainer {
-        padding: 0.5rem 0;
-    }
-    
-    /* Improve expander styling */
-    .streamlit-expanderHeader {
-        font-weight: 500;
-    }
-    
-    /* Reduce excessive padding in plotly charts */
-    .js-plotly-plot {
-        margin: 0;
-    }
-    
-    /* Improve divider visibility */
-    hr {
-        margin: 1rem 0;
-        border: none;
-        border-top: 1px solid #e0e0e0;
-    }
-</style>
-""", unsafe_allow_html=True)
 
-from components.sidebar import render_sidebar_filters
+@st.cache_data(show_spinner=False)
+def _load_css(path: Path = STYLE_PATH) -> str:
+    """Read the dashboard stylesheet once per process."""
+    return path.read_text(encoding="utf-8")
+
+
+# Apply custom CSS for improved visual hierarchy
+st.markdown(f"<style>{_load_css()}</style>", unsafe_allow_html=True)
 
 
 def main() -> Dict[str, Any]:
     """Render the base layout with preloaded datasets and sidebar filters."""
 
-    df_players, df_teams = load_data()
-    filters = render_sidebar_filters(df_players)
+    df_players, df_teams, filter_options = load_data()
+    filters = render_sidebar_filters(filter_options)
 
     st.title("LOL Esports (LCK) Insights")
     st.caption("Explore player and team level trends across seasons.")
@@ -0,0 +1,86 @@
+"""Champion aggregates shared by the EDA and Champion Stats pages."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from components.data_loader import BAN_COLUMNS, PICK_COLUMNS, load_filtered
+from components.utils import FilterKey
+
+
+def champion_stats(players: pd.DataFrame, teams: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate picks, bans, wins, and rates per champion.
+
+    Picks, wins, and bans come from the team rows, whose pick/ban slots cover
+    both sides of every game; positions come from the player rows.
+
+    Args:
+        players: Player-level rows with ``gameid`` and ``position``.
+        teams: Team-level rows with ``result``, ``gameid`` and pick/ban columns.
+
+    Returns:
+        One row per picked or banned champion, sorted by name, with ``picks``,
+        ``wins``, ``losses``, ``bans``, ``total_games`` (picks + bans), the
+        percentages ``win_rate``, ``loss_rate``, ``pick_rate``, ``ban_rate`` and
+        ``p_b_rate`` (the last three per game), and ``position``.
+    """
+    if teams.empty:
+        return pd.DataFrame()
+
+    # Process Picks: mask the raw pick block once; results broadcast as a view, not a copy
+    pick_block = teams[[col for col in PICK_COLUMNS if col in teams.columns]].to_numpy()
+    picked = pd.notna(pick_block)
+    results = np.broadcast_to(teams["result"].to_numpy()[:, None], pick_block.shape)[picked]
+
+    # Calculate Pick Stats
+    pick_codes, pick_champions = pd.factorize(pick_block[picked], sort=True)
+    pick_counts = np.bincount(pick_codes, minlength=len(pick_champions))
+    win_counts = np.bincount(pick_codes, weights=results, minlength=len(pick_champions))
+
+    # Process Bans
+    ban_block = teams[[col for col in BAN_COLUMNS if col in teams.columns]].to_numpy()
+    ban_codes, ban_champions = pd.factorize(ban_block[pd.notna(ban_block)], sort=True)
+    ban_counts = np.bincount(ban_codes, minlength=len(ban_champions))
+
+    # Align both count tables on the sorted union of champions by index lookup
+    # instead of an outer merge; absent counts are 0
+    pick_champions, ban_champions = pd.Index(pick_champions), pd.Index(ban_champions)
+    champions = pick_champions.union(ban_champions)
+    pick_stats = pd.DataFrame({"picks": pick_counts, "wins": win_counts}, index=pick_champions)
+    stats = pick_stats.reindex(champions, fill_value=0).astype(int)
+    stats["losses"] = stats["picks"] - stats["wins"]
+    stats["bans"] = pd.Series(ban_counts, index=ban_champions).reindex(champions, fill_value=0)
+    stats = stats.rename_axis("champion").reset_index()
+    stats["total_games"] = stats["picks"] + stats["bans"]
+
+    # Calculate Rates
+    stats["win_rate"] = (stats["wins"] / stats["picks"] * 100).fillna(0)
+    stats["loss_rate"] = (stats["losses"] / stats["picks"] * 100).fillna(0)
+
+    # Per-game rates over the player rows; ten of them make up one game when there is no gameid
+    games = players["gameid"].nunique() if "gameid" in players.columns else len(players) / 10
+    stats["pick_rate"] = stats["picks"] / games * 100 if games > 0 else 0.0
+    stats["ban_rate"] = stats["bans"] / games * 100 if games > 0 else 0.0
+    stats["p_b_rate"] = stats["pick_rate"] + stats["ban_rate"]
+
+    # Merge positions into a string from the distinct (champion, position) pairs,
+    # which leaves at most a handful of rows per champion to join
+    pairs = players[["champion", "position"]].drop_duplicates()
+    pairs = pairs.assign(position=pairs["position"].astype(str)).sort_values("position")
+    positions = pairs.groupby("champion", observed=True)["position"].agg("/".join)
+    positions.index = positions.index.astype(str)
+    stats["position"] = stats["champion"].map(positions)
+
+    return stats
+
+
+@st.cache_data(show_spinner=False)
+def compute_champion_stats(filter_key: FilterKey) -> pd.DataFrame:
+    """Cached ``champion_stats`` for the rows matching the sidebar selection.
+
+    Every page with the same selection shares one cache entry.
+    """
+    filters = dict(filter_key)
+    return champion_stats(load_filtered("players", filters), load_filtered("teams", filters))
@@ -3,46 +3,49 @@
 from __future__ import annotations
 
 from collections import OrderedDict
+from itertools import chain
 from typing import Iterable, Mapping, MutableMapping, Sequence
 
-import numpy as np
 import pandas as pd
-import plotly.express as px
 import plotly.graph_objects as go
+import streamlit as st
 
 from config.colors import CHART_COLORS, QUALITATIVE_COLORS
 
 DEFAULT_TRACE_COLOR = CHART_COLORS["primary"]
 QUAL_COLORS = QUALITATIVE_COLORS
+_COLOR_CYCLE: tuple[str, ...] = tuple(QUAL_COLORS) or (DEFAULT_TRACE_COLOR,)
 
 
 def _normalize_stats(stats_data: Mapping | MutableMapping | pd.Series | pd.DataFrame) -> OrderedDict[str, float]:
     """Convert supported inputs into an ordered mapping of numeric stats."""
 
     if isinstance(stats_data, pd.Series):
-        iterable = stats_data.items()
+        raw = stats_data
     elif isinstance(stats_data, pd.DataFrame):
         if stats_data.shape[0] != 1:
             raise ValueError("DataFrame input must contain exactly one row for radar charts.")
-        iterable = stats_data.iloc[0].items()
+        raw = stats_data.iloc[0]
     elif isinstance(stats_data, Mapping):
-        iterable = stats_data.items()
+        raw = pd.Series(dict(stats_data.items()), dtype=object)
     else:
         raise TypeError("stats_data must be a mapping, pandas Series, or single-row DataFrame.")
 
-    ordered: OrderedDict[str, float] = OrderedDict()
-    for key, value in iterable:
-        if value is None or (isinstance(value, float) and np.isnan(value)):
-            continue
-        try:
-            ordered[str(key)] = float(value)
-        except (TypeError, ValueError) as exc:
-            raise ValueError(f"Stat '{key}' must be numeric.") from exc
+    try:
+        numeric = pd.to_numeric(raw, errors="coerce")
+    except (TypeError, ValueError) as exc:
+        raise ValueError("All stats must be numeric.") from exc
 
-    if not ordered:
+    # Coercion turns bad values into NaN; only genuinely missing inputs may be dropped.
+    invalid = numeric.isna().to_numpy() & raw.notna().to_numpy()
+    if invalid.any():
+        raise ValueError(f"Stat '{raw.index[invalid][0]}' must be numeric.")
+
+    numeric = numeric.dropna()
+    if numeric.empty:
         raise ValueError("At least one numeric stat is required for the radar chart.")
 
-    return ordered
+    return OrderedDict(zip(map(str, numeric.index), numeric.to_numpy(dtype=float).tolist()))
 
 
 def _ensure_series(stats_data: Iterable | Mapping | pd.Series | pd.DataFrame) -> list[OrderedDict[str, float]]:
@@ -81,23 +84,41 @@ def create_radar_chart(
     if len(labels) != len(series):
         raise ValueError("labels length must match the number of series provided.")
 
-    categories: list[str] = []
-    for stats in series:
-        for key in stats.keys():
-            if key not in categories:
-                categories.append(key)
+    return _build_radar_figure(
+        tuple(tuple(stats.items()) for stats in series),
+        title,
+        tuple(labels),
+        tuple(radar_range) if radar_range else None,
+        trace_color,
+    )
 
-    color_cycle = QUAL_COLORS or [DEFAULT_TRACE_COLOR]
-    fig = go.Figure()
-    all_values: list[float] = []
 
-    for idx, (stats, label) in enumerate(zip(series, labels)):
-        values = [stats.get(cat, 0.0) for cat in categories]
-        all_values.extend(values)
-        color = trace_color if len(series) == 1 and trace_color else color_cycle[idx % len(color_cycle)]
+@st.cache_data(show_spinner=False)
+def _build_radar_figure(
+    series_items: tuple[tuple[tuple[str, float], ...], ...],
+    title: str,
+    labels: tuple[str, ...],
+    radar_range: tuple[float, float] | None,
+    trace_color: str | None,
+) -> go.Figure:
+    """Construct the radar figure from hashable, already-normalized inputs.
+
+    Cached so identical stats (e.g. reruns triggered by unrelated widgets) reuse
+    the figure instead of rebuilding traces and layout.
+    """
+
+    # Ordered union of categories in first-seen order; dict keys give O(1) membership.
+    categories = list(dict.fromkeys(key for key, _ in chain.from_iterable(series_items)))
+    # One frame aligns every series on that union; missing stats become 0.
+    stats_frame = pd.DataFrame([dict(items) for items in series_items], columns=categories).fillna(0.0)
+    values_matrix = stats_frame.to_numpy(dtype=float)
+
+    fig = go.Figure()
+    for idx, label in enumerate(labels):
+        color = trace_color if len(labels) == 1 and trace_color else _COLOR_CYCLE[idx % len(_COLOR_CYCLE)]
         fig.add_trace(
             go.Scatterpolar(
-                r=values,
+                r=values_matrix[idx].tolist(),
                 theta=categories,
                 fill="toself",
                 name=label,
@@ -107,12 +128,12 @@ def create_radar_chart(
             )
         )
 
-    computed_max = max(all_values) if all_values else 1
+    computed_max = float(values_matrix.max()) if values_matrix.size else 1
     radial_min, radial_max = radar_range if radar_range else (0, computed_max * 1.1 or 1)
 
     fig.update_layout(
         title=title,
-        showlegend=len(series) > 1,
+        showlegend=len(labels) > 1,
         legend=dict(orientation="h", yanchor="bottom", y=-0.1, xanchor="center", x=0.5),
         polar=dict(
             radialaxis=dict(
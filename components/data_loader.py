@@ -3,13 +3,52 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Dict, Iterable, List, Mapping
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
+from components.sidebar import FILTER_CONFIG
+from components.utils import FilterIndex, FilterKey, apply_filters, build_filter_index, make_filter_key
+
+# Slices share buffers with their parent until written to, so the cached frames
+# can be filtered and subset freely without defensive copies.
+pd.set_option("mode.copy_on_write", True)
+
 DEFAULT_DATA_PATH = Path("data") / "lck.csv"
 DEFAULT_NA_VALUES: tuple[str, ...] = ("", "NA", "N/A")
+# Part of the Parquet cache file name; bump whenever the cleaning or dtype steps
+# in _read_dataset change, so caches written by an older build are never served.
+PARQUET_CACHE_VERSION = 3
+PICK_COLUMNS: tuple[str, ...] = tuple(f"pick{i}" for i in range(1, 6))
+BAN_COLUMNS: tuple[str, ...] = tuple(f"ban{i}" for i in range(1, 6))
+CATEGORICAL_COLUMNS: tuple[str, ...] = (
+    "position",
+    "split",
+    "playoffs",
+    "patch",
+    "side",
+    "league",
+    "teamname",
+    "champion",
+    "playername",
+    "playerid",
+    *PICK_COLUMNS,
+    *BAN_COLUMNS,
+)
+# 0/1 outcome flags; stored as int8 in a frame wherever they have no missing values.
+FLAG_COLUMNS: tuple[str, ...] = (
+    "result",
+    "firstblood",
+    "firstdragon",
+    "firstherald",
+    "firstbaron",
+    "firsttower",
+    "firstmidtower",
+    "firsttothreetowers",
+    "atakhans",
+)
 
 
 def _resolve_column(columns: Iterable[str], *candidates: str) -> str:
@@ -20,27 +59,127 @@ def _resolve_column(columns: Iterable[str], *candidates: str) -> str:
 
 
 def _drop_unnamed_columns(df: pd.DataFrame) -> pd.DataFrame:
-    unnamed_cols = [col for col in df.columns if col.strip().lower().startswith("unnamed")]
+    # The C parser names a blank header "Unnamed: N"; the Arrow parser leaves it empty.
+    unnamed_cols = [
+        col for col in df.columns if not col.strip() or col.strip().lower().startswith("unnamed")
+    ]
     if unnamed_cols:
         df = df.drop(columns=unnamed_cols)
     return df
 
 
-def _safe_numeric(series: pd.Series) -> pd.Series:
-    return pd.to_numeric(series, errors="coerce").fillna(0)
+def _numeric_array(series: pd.Series) -> np.ndarray:
+    """Coerce ``series`` to a float32 array with missing values set to 0."""
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float32, na_value=0)
+
+
+def _downcast_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Shrink numeric columns to the narrowest dtype and categorize labels."""
+    dtypes: Dict[str, Any] = {
+        col: pd.to_numeric(df[col], downcast="integer").dtype
+        for col in df.select_dtypes(include="integer").columns
+    }
+    # Label columns keep full precision so e.g. patch 15.06 doesn't surface as 15.0600004.
+    for col in df.select_dtypes(include="float").columns.difference(CATEGORICAL_COLUMNS):
+        dtypes[col] = np.float32
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            dtypes[col] = "category"
+    # astype leaves one block per column; consolidating once makes every later row
+    # slice a handful of takes instead of one per column.
+    return df.astype(dtypes).copy()
+
+
+def _compact_flags(df: pd.DataFrame) -> pd.DataFrame:
+    """Store fully populated 0/1 flag columns as ``int8``."""
+    for col in FLAG_COLUMNS:
+        if col in df.columns and not df[col].isna().any():
+            df[col] = df[col].astype(np.int8)
+    return df
+
+
+def _remove_unused_categories(df: pd.DataFrame) -> pd.DataFrame:
+    for col in df.select_dtypes(include="category").columns:
+        df[col] = df[col].cat.remove_unused_categories()
+    return df
+
+
+def sorted_unique(series: pd.Series) -> List[Any]:
+    """Return the distinct non-null values of ``series`` in ascending order.
+
+    Categoricals only look at their observed codes, numeric values are sorted by
+    NumPy, and anything else is ordered by its string form.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        values = series.cat.categories.take(np.unique(codes[codes >= 0]))
+    else:
+        values = pd.Index(series.dropna().unique())
+    if values.dtype.kind in "iufb":
+        return np.sort(values.to_numpy()).tolist()
+    return sorted(values.tolist(), key=str)
+
+
+def _read_dataset(csv_path: Path) -> pd.DataFrame:
+    """Read the cleaned frame, preferring a sibling Parquet cache over the CSV.
+
+    The cache (``<name>.v<PARQUET_CACHE_VERSION>.parquet``) is rebuilt whenever
+    the CSV is newer or the cache cannot be read. Failing to write it (e.g. a
+    read-only deploy) is not an error; the CSV result is returned as-is.
+    """
+    parquet_path = csv_path.with_suffix(f".v{PARQUET_CACHE_VERSION}.parquet")
+    if parquet_path.exists() and parquet_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            return pd.read_parquet(parquet_path, engine="pyarrow", memory_map=True)
+        except (OSError, ValueError):
+            # Truncated or corrupt cache; fall through and rebuild it from the CSV
+            pass
+
+    # Arrow's multi-threaded parser; frames keep NumPy dtypes so downcasting still applies.
+    # Arrow would infer timestamps, so ``date`` is pinned to the plain strings the C parser gave.
+    df = pd.read_csv(
+        csv_path,
+        engine="pyarrow",
+        keep_default_na=True,
+        na_values=list(DEFAULT_NA_VALUES),
+        dtype={"date": str},
+    )
+    df = _drop_unnamed_columns(df)
+    df = df.rename(columns=lambda col: col.strip())
+    df = _downcast_dtypes(df)
+
+    try:
+        df.to_parquet(parquet_path, engine="pyarrow", compression="snappy", index=False)
+    except (OSError, ValueError, ImportError):
+        pass
+    return df
 
 
-@st.cache_data
-def load_data(file_path: str | Path = DEFAULT_DATA_PATH) -> tuple[pd.DataFrame, pd.DataFrame]:
+def _build_filter_options(df: pd.DataFrame) -> Dict[str, List[Any]]:
+    """Collect the sorted option list for every sidebar filter column present."""
+    return {column: sorted_unique(df[column]) for column, _ in FILTER_CONFIG if column in df.columns}
+
+
+@st.cache_resource(show_spinner=False)
+def load_data(
+    file_path: str | Path = DEFAULT_DATA_PATH,
+) -> tuple[pd.DataFrame, pd.DataFrame, Dict[str, List[Any]]]:
     """Load, clean, and split the LCK dataset for players and teams.
 
     Args:
         file_path: Path to the CSV file. Defaults to ``data/lck.csv``.
 
     Returns:
-        Tuple of two DataFrames: (players, teams). The players DataFrame includes
+        Tuple of (players, teams, filter_options). The players DataFrame includes
         a computed ``KDA`` column, while the teams DataFrame contains rows where
-        ``position == 'team'``.
+        ``position == 'team'``. ``filter_options`` maps each sidebar filter
+        column to its sorted unique values so reruns never rescan the frame.
+
+    Note:
+        The result is cached with ``st.cache_resource``, so every caller shares
+        the same objects. Copy-on-Write keeps writes to derived frames from
+        reaching the cache, but columns must not be added to or assigned on the
+        returned frames themselves.
 
     Raises:
         FileNotFoundError: If the CSV cannot be located.
@@ -52,9 +191,7 @@ def load_data(file_path: str | Path = DEFAULT_DATA_PATH) -> tuple[pd.DataFrame,
     if not csv_path.exists():
         raise FileNotFoundError(f"Could not locate data file at {csv_path}")
 
-    df = pd.read_csv(csv_path, keep_default_na=True, na_values=DEFAULT_NA_VALUES)
-    df = _drop_unnamed_columns(df)
-    df = df.rename(columns=lambda col: col.strip())
+    df = _read_dataset(csv_path)
 
     position_col = _resolve_column(df.columns, "position", "Position")
     player_identifier_col = _resolve_column(df.columns, "playerid", "playername", "participantid")
@@ -62,29 +199,86 @@ def load_data(file_path: str | Path = DEFAULT_DATA_PATH) -> tuple[pd.DataFrame,
     assists_col = _resolve_column(df.columns, "Assists", "assists")
     deaths_col = _resolve_column(df.columns, "Deaths", "deaths")
 
-    df = df.dropna(subset=[position_col]).copy()
-    positions = df[position_col].astype(str).str.strip()
-    positions_lower = positions.str.lower()
-
-    non_team_mask = positions_lower != "team"
-    valid_players_mask = df[player_identifier_col].notna()
-    df = df[~non_team_mask | (non_team_mask & valid_players_mask)].copy()
+    df = df.dropna(subset=[position_col])
+    positions = df[position_col].astype("category")
+    # Normalize the handful of categories rather than every row, then compare codes.
+    normalized = positions.cat.categories.astype(str).str.strip().str.lower()
+    team_codes = np.flatnonzero(normalized == "team")
+    non_team_mask = ~np.isin(positions.cat.codes.to_numpy(), team_codes)
+    valid_players_mask = df[player_identifier_col].notna().to_numpy()
+    players_mask = non_team_mask & valid_players_mask
 
-    df_players = df[non_team_mask & valid_players_mask].copy()
-    df_teams = df[~non_team_mask].copy()
+    df_players = df.loc[players_mask].reset_index(drop=True)
+    df_teams = df.loc[~non_team_mask].reset_index(drop=True)
 
     if df_players.empty:
         raise ValueError("No player-level rows were found in the dataset.")
     if df_teams.empty:
         raise ValueError("No team-level rows were found in the dataset.")
 
-    kills = _safe_numeric(df_players[kills_col])
-    assists = _safe_numeric(df_players[assists_col])
-    deaths = _safe_numeric(df_players[deaths_col]).replace(0, 1)
-    df_players["KDA"] = (kills + assists) / deaths
+    kills = _numeric_array(df_players[kills_col])
+    assists = _numeric_array(df_players[assists_col])
+    deaths = _numeric_array(df_players[deaths_col])
+    np.maximum(deaths, 1, out=deaths)
+    kda = np.add(kills, assists)
+    np.divide(kda, deaths, out=kda)
+    df_players["KDA"] = kda
+
+    df_players = _compact_flags(_remove_unused_categories(df_players))
+    df_teams = _compact_flags(_remove_unused_categories(df_teams))
+
+    filter_options = _build_filter_options(df_players)
+
+    return df_players, df_teams, filter_options
+
+
+
+@st.cache_resource(show_spinner=False)
+def load_filter_index(frame: str = "players", file_path: str | Path = DEFAULT_DATA_PATH) -> FilterIndex:
+    """Build the sidebar-filter inverted index for one of the cached frames.
+
+    Args:
+        frame: ``"players"`` or ``"teams"``, selecting which ``load_data`` frame
+            to index.
+        file_path: Same dataset path passed to ``load_data``.
+
+    Returns:
+        Mapping of filter column to ``{value: row positions}``, for use as the
+        ``index`` argument of ``apply_filters``.
+    """
+    return build_filter_index(_select_frame(frame, file_path), [column for column, _ in FILTER_CONFIG])
+
+
+def load_filtered(
+    frame: str,
+    filters: Mapping[str, Any],
+    file_path: str | Path = DEFAULT_DATA_PATH,
+) -> pd.DataFrame:
+    """Return the ``frame`` rows matching the sidebar ``filters``.
+
+    Every page asking for the same frame and selection shares one cached view,
+    so switching pages or rerunning with unchanged filters never re-slices.
+    Like ``load_data``, the result is shared and must be treated as read-only.
+    """
+    return _filtered_view(frame, make_filter_key(filters), file_path)
+
 
-    df_players = df_players.reset_index(drop=True)
-    df_teams = df_teams.reset_index(drop=True)
+@st.cache_resource(show_spinner=False, max_entries=64)
+def _filtered_view(
+    frame: str,
+    filter_items: FilterKey,
+    file_path: str | Path,
+) -> pd.DataFrame:
+    return apply_filters(
+        _select_frame(frame, file_path),
+        dict(filter_items),
+        index=load_filter_index(frame, file_path),
+    )
 
-    return df_players, df_teams
 
+def _select_frame(frame: str, file_path: str | Path) -> pd.DataFrame:
+    df_players, df_teams, _ = load_data(file_path)
+    frames = {"players": df_players, "teams": df_teams}
+    if frame not in frames:
+        raise ValueError(f"Unknown frame '{frame}'; expected 'players' or 'teams'.")
+    return frames[frame]
@@ -0,0 +1,270 @@
+"""Player lookups and factor scores shared by the Player Profile and Comparison pages."""
+
+from __future__ import annotations
+
+import re
+from itertools import chain
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from components.data_loader import load_filtered, sorted_unique
+from components.utils import FilterKey
+
+CLUSTER_DATA_PATH = Path("data") / "val.csv"
+CLUSTER_IDS: tuple[int, ...] = tuple(range(1, 9))
+_CLUSTER_RE = re.compile(r"\d+")
+# Cluster mapping (Updated to 8 Factors)
+CLUSTER_NAMES: Dict[int, str] = {
+    1: '성장 기반 운영력 (Resource & Vision Baseline)',
+    2: '후반 캐리 및 공성력 (Late-Game Carry & Siege)',
+    3: '팀파이트 및 지원 능력 (Teamfight & Support)',
+    4: '라인전 압도 지수 (Laning Phase Dominance)',
+    5: '사망 기여 및 위험도 (Mortality & Risk)',
+    6: '방어/전선 유지 및 중립 오브젝트 (Frontline & Objective)',
+    7: '공격적 주도권 (Aggressive Initiative)',
+    8: '상대팀 전투 우위 (Enemy Combat Advantage)'
+}
+# Short Cluster Names, for the comparison charts
+CLUSTER_SHORT_NAMES: Dict[int, str] = {
+    1: '성장',
+    2: '후반',
+    3: '팀파이트',
+    4: '라인전',
+    5: '사망',
+    6: '방어',
+    7: '공격',
+    8: '전투우위'
+}
+# Negative indicators (5: Deaths, 8: Enemy Combat Advantage)
+NEGATIVE_CLUSTERS: tuple[int, ...] = (5, 8)
+# Display names first, so the selectors list players by name whenever possible.
+PLAYER_ID_CANDIDATES: tuple[str, ...] = ("playername", "playerid", "participantid")
+# Columns read by the "Most 5 Champions" aggregation; the groupby only sees these.
+MOST_CHAMPS_COLUMNS: tuple[str, ...] = (
+    "champion",
+    "result",
+    "KDA",
+    "golddiffat10",
+    "golddiffat15",
+    "golddiffat20",
+    "golddiffat25",
+    "cspm",
+    "dpm",
+    "visionscore",
+)
+
+
+def player_id_column(df: pd.DataFrame) -> Optional[str]:
+    """Return the first ``PLAYER_ID_CANDIDATES`` column present in ``df``."""
+    return next((col for col in PLAYER_ID_CANDIDATES if col in df.columns), None)
+
+
+@st.cache_data(show_spinner=False)
+def load_cluster_info(file_path: str | Path = CLUSTER_DATA_PATH) -> pd.DataFrame:
+    """Load cluster definitions from csv.
+
+    The file has a header like ``,0`` and rows like ``kills,Factor 2``; the
+    cluster id is the number in the factor label, or -1 when it has none.
+    """
+    file_path = Path(file_path)
+    if not file_path.exists():
+        st.error(f"Cluster data not found at {file_path}")
+        return pd.DataFrame()
+
+    try:
+        df = pd.read_csv(file_path)
+        # Expecting the first column to be variable and second to be the factor string
+        if len(df.columns) >= 2:
+            df.columns = ['variable', 'cluster_label'] + list(df.columns[2:])
+            labels = df['cluster_label'].astype(str)
+            df['cluster'] = np.fromiter(
+                (int(m.group()) if (m := _CLUSTER_RE.search(label)) else -1 for label in labels),
+                dtype=np.int8,
+                count=len(df),
+            )
+            return df
+    except Exception as e:
+        st.error(f"Error loading cluster data: {e}")
+        return pd.DataFrame()
+
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def load_cluster_variables() -> Dict[int, List[str]]:
+    """Map each cluster id to its variables, in file order, grouped once."""
+    cluster_df = load_cluster_info()
+    if cluster_df.empty:
+        return {}
+    return cluster_df.groupby('cluster', sort=False)['variable'].apply(list).to_dict()
+
+
+@st.cache_data(show_spinner=False)
+def position_rows(filter_key: FilterKey) -> Dict[str, np.ndarray]:
+    """Row positions of every position in the filtered players, built in one groupby pass."""
+    return load_filtered("players", dict(filter_key)).groupby('position', observed=True).indices
+
+
+@st.cache_data(show_spinner=False)
+def player_rows(filter_key: FilterKey, player_id_col: str) -> Dict[Any, np.ndarray]:
+    """Row positions of every player in the filtered players, built in one groupby pass.
+
+    Args:
+        player_id_col: Column identifying players, from ``player_id_column``.
+    """
+    return load_filtered("players", dict(filter_key)).groupby(player_id_col, observed=True).indices
+
+
+@st.cache_data(show_spinner=False)
+def players_by_position(filter_key: FilterKey, player_id_col: str) -> Dict[str, List[Any]]:
+    """Sorted player ids of every position in the filtered players, for the selectors.
+
+    Args:
+        player_id_col: Column identifying players, from ``player_id_column``.
+    """
+    players = load_filtered("players", dict(filter_key))[player_id_col]
+    return {position: sorted_unique(players.take(rows)) for position, rows in position_rows(filter_key).items()}
+
+
+def _score_one_cluster(X: np.ndarray, X_scaled: np.ndarray) -> np.ndarray:
+    """Composite score column for one cluster from its raw and standardized columns."""
+    # If only 1 variable, use it directly (standardized)
+    if X_scaled.shape[1] == 1:
+        scores = X_scaled
+    else:
+        # The first principal component is the single composite score for the
+        # cluster; one LAPACK SVD replaces the iterative FA fit
+        U, S, _ = np.linalg.svd(X_scaled, full_matrices=False)
+        scores = U[:, :1] * S[0]
+
+    # Flip so that "more stats" = "higher score". Scores are zero-mean, so the
+    # sign of a plain dot product with the row sums is the sign of their correlation
+    if float(scores.ravel() @ X.sum(axis=1)) < 0:
+        scores = -scores
+    return scores
+
+
+def position_scores(
+    rows: Optional[np.ndarray], full_data: pd.DataFrame
+) -> Dict[int, Tuple[List[str], Optional[np.ndarray]]]:
+    """Fit every cluster once for the whole position cohort.
+
+    Args:
+        rows: Row positions of the cohort in ``full_data``, as given by
+            ``position_rows``; ``None`` for a position with no rows.
+        full_data: Filtered player rows for every position.
+
+    Returns:
+        ``{cluster_id: (valid_vars, scores)}`` where ``scores`` is a column vector
+        aligned with ``rows``, or ``None`` when none of the cluster's variables
+        exist. Empty when the cluster file is missing or the cohort has fewer
+        than 3 rows.
+    """
+    cluster_to_vars = load_cluster_variables()
+    if not cluster_to_vars:
+        return {}
+
+    if rows is None or len(rows) < 3:
+        return {}
+
+    # Filter variables that exist in the data
+    cluster_vars = {}
+    for cluster_id in CLUSTER_IDS:
+        vars_in_cluster = cluster_to_vars.get(cluster_id, [])
+        cluster_vars[cluster_id] = [v for v in vars_in_cluster if v in full_data.columns]
+
+    # Standardize every cluster variable in one pass; clusters then select columns.
+    # Constant columns scale to 0, as with StandardScaler.
+    all_vars = list(dict.fromkeys(chain.from_iterable(cluster_vars.values())))
+    col_idx = {v: i for i, v in enumerate(all_vars)}
+    # Only the cluster columns of the cohort rows are gathered, straight into one
+    # float32 matrix (the stored dtype of the stat columns) with missing values as 0
+    X_all = full_data[all_vars].take(rows).to_numpy(dtype=np.float32, na_value=0)
+    # Moments accumulate in float64 so constant columns get an exact zero std
+    std = X_all.std(axis=0, dtype=np.float64)
+    std[std == 0] = 1.0
+    X_all_scaled = (X_all - X_all.mean(axis=0, dtype=np.float64)) / std
+
+    results = {}
+
+    for cluster_id, valid_vars in cluster_vars.items():
+        if not valid_vars:
+            results[cluster_id] = ([], None)
+            continue
+
+        cols = [col_idx[v] for v in valid_vars]
+        results[cluster_id] = (valid_vars, _score_one_cluster(X_all[:, cols], X_all_scaled[:, cols]))
+
+    return results
+
+
+@st.cache_data(show_spinner=False)
+def compute_position_scores(
+    position: str, filter_key: FilterKey
+) -> Dict[int, Tuple[List[str], Optional[np.ndarray]]]:
+    """Cached ``position_scores`` for the players matching the sidebar selection.
+
+    Keyed on the filter tuple rather than the frame, so reruns never hash the
+    rows and switching players never refits; only a sidebar change does. The
+    cohort is ``position_rows(filter_key)[position]``, the same rows the pages
+    index the scores with.
+    """
+    rows = position_rows(filter_key).get(position)
+    return position_scores(rows, load_filtered("players", dict(filter_key)))
+
+
+def calculate_factor_scores(
+    player_id: Any,
+    position: str,
+    full_data: pd.DataFrame,
+    filter_key: FilterKey,
+    player_id_col: str,
+    names: Mapping[int, str] = CLUSTER_NAMES,
+    invert_negative: bool = False,
+) -> Dict[int, Dict[str, Any]]:
+    """Calculate Factor scores for the player based on clusters, relative to their position.
+
+    Args:
+        player_id: Value of ``player_id_col`` identifying the player.
+        position: Position whose cohort the player is scored against.
+        full_data: Filtered player rows for ``filter_key``.
+        filter_key: ``FilterKey`` of the sidebar selection.
+        player_id_col: Column identifying players, from ``player_id_column``.
+        names: Display name per cluster id.
+        invert_negative: Flip ``NEGATIVE_CLUSTERS`` so that a higher score
+            always means better performance.
+
+    Returns:
+        ``{cluster_id: {'name': str, 'score': float, 'vars': list}}`` with the
+        score on the N(50, 10) scale; empty when the player has no rows in the
+        position cohort.
+    """
+    # Get player's rows within the position cohort
+    rows = position_rows(filter_key).get(position)
+    if rows is None:
+        return {}
+    player_idx = np.flatnonzero((full_data[player_id_col].take(rows) == player_id).to_numpy())
+    if len(player_idx) == 0:
+        return {}
+
+    results = {}
+    for cluster_id, (valid_vars, scores) in compute_position_scores(position, filter_key).items():
+        name = names.get(cluster_id, str(cluster_id))
+        if scores is None:
+            results[cluster_id] = {'name': name, 'score': 0.0, 'vars': []}
+            continue
+
+        # Get score for the specific player
+        player_score = scores[player_idx].mean()
+        # Standardized score on the N(50, 10) scale shown on the pages
+        percentile = 50 + (player_score - scores.mean()) / scores.std() * 10
+        if invert_negative and cluster_id in NEGATIVE_CLUSTERS:
+            percentile = 100 - percentile
+
+        results[cluster_id] = {'name': name, 'score': percentile, 'vars': valid_vars}
+
+    return results
@@ -0,0 +1,27 @@
+"""Global sidebar selection shared by the dashboard pages."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Tuple
+
+import pandas as pd
+
+from components.data_loader import DEFAULT_DATA_PATH, load_data, load_filtered
+from components.sidebar import render_sidebar_filters
+from components.utils import FilterKey, make_filter_key
+
+
+def load_selection(
+    frame: str, file_path: str | Path = DEFAULT_DATA_PATH
+) -> Tuple[pd.DataFrame, FilterKey]:
+    """Render the sidebar filters and return the matching ``frame`` rows.
+
+    Returns:
+        Tuple of (rows, filter_key). ``rows`` is the shared ``load_filtered``
+        view; ``filter_key`` is its ``FilterKey``, the key the per-selection
+        ``st.cache_data`` helpers take instead of a frame.
+    """
+    _, _, filter_options = load_data(file_path)
+    filters = render_sidebar_filters(filter_options)
+    return load_filtered(frame, filters, file_path), make_filter_key(filters)
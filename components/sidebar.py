@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Sequence, Tuple
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 import streamlit as st
 
@@ -15,28 +15,23 @@ FILTER_CONFIG: Sequence[Tuple[str, str]] = (
 )
 
 
-def _sorted_unique(series: Any) -> List[Any]:
-    values = series.dropna().unique().tolist()
-    if not values:
-        return []
-    try:
-        return sorted(values)
-    except TypeError:
-        return sorted(values, key=lambda value: str(value))
+def render_sidebar_filters(filter_options: Mapping[str, List[Any]]) -> Dict[str, Any]:
+    """Render the global sidebar filters and return the selected values.
 
-
-def render_sidebar_filters(df_players) -> Dict[str, Any]:
-    """Render the global sidebar filters and return the selected values."""
+    Args:
+        filter_options: Sorted option lists per filter column, as returned by
+            ``load_data``.
+    """
     st.sidebar.title("LCK Global Filters")
     filters: Dict[str, Any] = {}
 
     for column, label in FILTER_CONFIG:
-        if column not in df_players.columns:
+        if column not in filter_options:
             st.sidebar.warning(f"Missing '{column}' column in dataset.")
             filters[column] = None
             continue
 
-        options = [ALL_OPTION] + _sorted_unique(df_players[column])
+        options = [ALL_OPTION] + list(filter_options[column])
         if len(options) == 1:
             st.sidebar.warning(f"No data available for {label} filter.")
             filters[column] = None
@@ -58,9 +53,11 @@ def render_sidebar_filters(df_players) -> Dict[str, Any]:
         )
         filters[column] = None if selection == ALL_OPTION else selection
 
+    st.session_state["filters"] = filters
+
     st.sidebar.caption("필터는 세션 전체에서 공유됩니다.")
-    with st.sidebar.expander("선택된 필터", expanded=False):
-        st.json(filters)
+    # Only serialize the selection when asked; an expander encodes its body every rerun.
+    if st.sidebar.checkbox("선택된 필터 보기", value=False, key="_show_filters"):
+        st.sidebar.json(filters)
 
-    st.session_state["filters"] = filters
     return filters
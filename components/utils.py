@@ -1,28 +1,94 @@
 """Utility functions for the LCK dashboard."""
 
-from typing import Any, Dict
+from functools import reduce
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import streamlit as st
 
 
-def apply_filters(df: pd.DataFrame, filters: Dict[str, Any]) -> pd.DataFrame:
+def _equals_mask(series: pd.Series, value: Any) -> np.ndarray:
+    """Return a NumPy boolean mask of ``series == value``.
+
+    Categorical columns compare their integer codes against the code of ``value``
+    instead of materializing the labels.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        code = series.cat.categories.get_indexer([value])[0]
+        if code < 0:
+            return np.zeros(len(series), dtype=bool)
+        return series.cat.codes.to_numpy() == code
+    return series.to_numpy() == value
+
+
+FilterIndex = Dict[str, Dict[Any, np.ndarray]]
+# Hashable form of a sidebar selection; per-selection caches are keyed on it instead of a frame.
+FilterKey = Tuple[Tuple[str, Any], ...]
+
+
+def make_filter_key(filters: Mapping[str, Any]) -> FilterKey:
+    """Return the ``FilterKey`` of ``filters``, independent of their insertion order."""
+    return tuple(sorted(filters.items()))
+
+
+def build_filter_index(df: pd.DataFrame, columns: Iterable[str]) -> FilterIndex:
+    """Map every value of each low-cardinality ``column`` to its row positions.
+
+    Positions are ascending ``int32`` arrays, so intersecting them preserves the
+    frame's row order. Missing columns and missing values are left out.
+    """
+    index: FilterIndex = {}
+    for column in columns:
+        if column not in df.columns:
+            continue
+        codes, uniques = pd.factorize(df[column])
+        order = np.argsort(codes, kind="stable").astype(np.int32)
+        counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+        # Rows with a missing value (code -1) sort first; skip past them.
+        groups = np.split(order[len(codes) - counts.sum():], np.cumsum(counts)[:-1])
+        index[column] = dict(zip(uniques.tolist(), groups))
+    return index
+
+
+def apply_filters(
+    df: pd.DataFrame,
+    filters: Dict[str, Any],
+    index: Optional[Mapping[str, Mapping[Any, np.ndarray]]] = None,
+) -> pd.DataFrame:
     """Apply a dictionary of filters to a DataFrame.
     
     Args:
         df: The DataFrame to filter.
         filters: A dictionary where keys are column names and values are filter values.
                  Values of None, "", or "All" are ignored.
+        index: Optional inverted index from ``build_filter_index`` for ``df``.
+                 Indexed columns intersect precomputed row positions instead of
+                 scanning the column.
                  
     Returns:
-        The filtered DataFrame.
+        The filtered DataFrame. Active filters are fused into a single boolean
+        mask, so the frame is sliced exactly once; with no active filter ``df``
+        itself is returned and must be treated as read-only.
     """
-    filtered_df = df.copy()
+    masks = []
+    positions = []
     for column, value in filters.items():
         if value in (None, "", "All"):
             continue
-        if column not in filtered_df.columns:
+        if column not in df.columns:
             st.sidebar.warning(f"'{column}' 컬럼이 없어 필터를 건너뜀")
             continue
-        filtered_df = filtered_df[filtered_df[column] == value]
-    return filtered_df
+        if index is not None and column in index:
+            positions.append(index[column].get(value, np.empty(0, dtype=np.int32)))
+        else:
+            masks.append(_equals_mask(df[column], value))
+
+    if positions:
+        rows = reduce(lambda left, right: np.intersect1d(left, right, assume_unique=True), positions)
+        if masks:
+            rows = rows[np.logical_and.reduce(masks)[rows]]
+        return df.take(rows)
+    if not masks:
+        return df
+    return df.loc[np.logical_and.reduce(masks)]
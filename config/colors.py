@@ -1,7 +1,9 @@
 """Centralized color theme configuration for all charts and visualizations."""
 
-# Main color palette
-CHART_COLORS = {
+from types import MappingProxyType
+
+# Main color palette (read-only so a caller can't recolor every chart)
+CHART_COLORS = MappingProxyType({
     # Win/Loss colors
     "win": "#2ecc71",  # Green
     "loss": "#e74c3c",  # Red
@@ -31,7 +33,7 @@ CHART_COLORS = {
     "primary": "#1f77b4",  # Primary blue
     "secondary": "#2ecc71",  # Secondary green
     "accent": "#ff7f0e",  # Accent orange
-}
+})
 
 # Color mapping for discrete color scales
 COLOR_DISCRETE_MAP = {
@@ -42,7 +44,7 @@ COLOR_DISCRETE_MAP = {
 }
 
 # List of colors for multi-series charts (qualitative palette)
-QUALITATIVE_COLORS = [
+QUALITATIVE_COLORS = (
     CHART_COLORS["player_a"],
     CHART_COLORS["player_b"],
     CHART_COLORS["team_a"],
@@ -51,5 +53,5 @@ QUALITATIVE_COLORS = [
     "#9467bd",  # Purple
     "#8c564b",  # Brown
     "#e377c2",  # Pink
-]
+)
 
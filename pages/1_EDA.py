@@ -4,71 +4,100 @@ from __future__ import annotations
 
 from typing import Any, Dict
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
-from components.sidebar import render_sidebar_filters
 from config.colors import CHART_COLORS, COLOR_DISCRETE_MAP
-from components.data_loader import load_data
-from components.utils import apply_filters
-
-st.set_page_config(layout="wide")
-
-
-def _get_active_filters(df_players) -> Dict[str, Any]:
-    # Render sidebar and get filters directly
-    return render_sidebar_filters(df_players)
-
-
-def _process_champion_stats(df: pd.DataFrame) -> pd.DataFrame:
-    """Calculate champion picks, bans, wins, and losses."""
-    if df.empty:
-        return pd.DataFrame()
+from components.aggregations import compute_champion_stats
+from components.data_loader import load_filtered
+from components.selection import load_selection
+from components.utils import FilterKey
+
+
+def _top_k(df: pd.DataFrame, column: str, k: int = 10) -> pd.DataFrame:
+    """Top ``k`` rows by ``column`` as ``df.nlargest(k, column)`` picks them, without sorting the whole frame.
+
+    Ties always keep frame order (``keep="first"``), including on frames of at
+    most ``k`` rows, where pandas itself falls back to an unstable sort.
+    """
+    if len(df) <= k:
+        # Nothing to select; a stable sort keeps ties in frame order
+        return df.sort_values(column, ascending=False, kind="stable")
+    values = df[column].to_numpy()
+    # Partition around the k-th largest value and only sort the rows at or above it
+    kth = np.partition(values, len(values) - k)[len(values) - k]
+    candidates = np.flatnonzero(values >= kth)
+    # Stable descending order keeps ties in frame order, like nlargest(keep="first")
+    order = candidates[np.argsort(-values[candidates], kind="stable")]
+    return df.iloc[order[:k]]
+
+
+# Minimum picks for a champion to appear in the win/loss rate tables
+MIN_RATE_GAMES = 18
+OBJECTIVES = ["firstblood", "firstdragon", "firstbaron", "firsttower", "firstherald"]
+
+
+@st.cache_data(show_spinner=False)
+def _build_page_summary(filter_key: FilterKey) -> Dict[str, Any]:
+    """Aggregate every table and chart input of the page in one cached pass.
+
+    Each section then renders its own small frame without touching the filtered
+    team rows again. Missing inputs are ``None`` so sections can skip themselves.
+    """
+    team_df = load_filtered("teams", dict(filter_key))
+    stats = compute_champion_stats(filter_key)
+    summary: Dict[str, Any] = dict.fromkeys(
+        ["top_picks", "top_bans", "top_win", "top_loss", "side_wr", "durations", "obj_wr"]
+    )
+
+    if not stats.empty:
+        summary["top_picks"] = _top_k(stats, "picks")[["champion", "picks", "wins", "losses"]]
+        summary["top_bans"] = _top_k(stats, "bans")[["champion", "bans"]]
+
+        rate_stats = stats[stats["picks"] >= MIN_RATE_GAMES]
+        if not rate_stats.empty:
+            top_wins = _top_k(rate_stats, "win_rate")[["champion", "win_rate", "picks", "wins", "losses"]]
+            # Format rate
+            top_wins["win_rate"] = top_wins["win_rate"].map("{:.1f}%".format)
+            summary["top_win"] = top_wins
+            top_losses = _top_k(rate_stats, "loss_rate")[["champion", "loss_rate", "picks", "wins", "losses"]]
+            # Format rate
+            top_losses["loss_rate"] = top_losses["loss_rate"].map("{:.1f}%".format)
+            summary["top_loss"] = top_losses
 
-    # Process Picks
-    pick_cols = [f"pick{i}" for i in range(1, 6)]
-    # Subset to avoid conflict with existing 'champion' column
-    picks = df[["result"] + pick_cols].melt(id_vars=["result"], value_vars=pick_cols, value_name="champion").dropna(subset=["champion"])
-    
-    # Calculate Pick Stats
-    pick_stats = picks.groupby("champion").agg(
-        picks=("champion", "count"),
-        wins=("result", "sum")
-    ).reset_index()
-    pick_stats["losses"] = pick_stats["picks"] - pick_stats["wins"]
-
-    # Process Bans
-    ban_cols = [f"ban{i}" for i in range(1, 6)]
-    # Subset to avoid conflict
-    bans = df[ban_cols].melt(value_vars=ban_cols, value_name="champion").dropna(subset=["champion"])
-    ban_stats = bans["champion"].value_counts().reset_index()
-    ban_stats.columns = ["champion", "bans"]
-
-    # Merge Stats
-    stats = pd.merge(pick_stats, ban_stats, on="champion", how="outer").fillna(0)
-    stats["picks"] = stats["picks"].astype(int)
-    stats["wins"] = stats["wins"].astype(int)
-    stats["losses"] = stats["losses"].astype(int)
-    stats["bans"] = stats["bans"].astype(int)
-    stats["total_games"] = stats["picks"] + stats["bans"]
-    
-    # Calculate Rates
-    stats["win_rate"] = (stats["wins"] / stats["picks"] * 100).fillna(0)
-    stats["loss_rate"] = (stats["losses"] / stats["picks"] * 100).fillna(0)
-    
-    return stats
+    # Side Win Rate
+    if "side" in team_df.columns and "result" in team_df.columns:
+        side_wins = team_df.groupby("side", observed=True)["result"].mean().reset_index()
+        side_wins["result"] = side_wins["result"] * 100
+        summary["side_wr"] = side_wins
 
+    # Game Duration: convert seconds to minutes for better readability
+    if "gamelength" in team_df.columns:
+        summary["durations"] = team_df["gamelength"] / 60
 
-def _render_champion_analysis(team_df: pd.DataFrame):
+    # First Objectives Win Rate
+    objectives = [obj for obj in OBJECTIVES if obj in team_df.columns]
+    summary["obj_wr"] = pd.DataFrame()
+    if objectives and "result" in team_df.columns:
+        # Win rate when securing each objective (value == 1), all objectives in one pass
+        secured = team_df[objectives].to_numpy() == 1
+        taken = secured.sum(axis=0)
+        wins = team_df["result"].to_numpy(dtype=float) @ secured
+        summary["obj_wr"] = pd.DataFrame({
+            "Objective": objectives,
+            "Win Rate": np.divide(wins, taken, out=np.zeros_like(wins), where=taken > 0) * 100,
+        })[taken > 0]
+
+    return summary
+
+
+def _render_champion_analysis(summary: Dict[str, Any]):
     st.subheader("Champion Analysis (Team Data)")
-    
-    if team_df.empty:
-        st.warning("No team data found.")
-        return
 
-    stats = _process_champion_stats(team_df)
-    if stats.empty:
+    if summary["top_picks"] is None:
         st.warning("No champion statistics could be calculated.")
         return
 
@@ -77,118 +106,98 @@ def _render_champion_analysis(team_df: pd.DataFrame):
     
     with col1:
         st.markdown("### Most Picked")
-        top_picks = stats.nlargest(10, "picks")[["champion", "picks", "wins", "losses"]]
-        st.dataframe(top_picks, width="stretch", hide_index=True)
+        st.dataframe(summary["top_picks"], width="stretch", hide_index=True)
 
     with col2:
         st.markdown("### Most Banned")
-        top_bans = stats.nlargest(10, "bans")[["champion", "bans"]]
-        st.dataframe(top_bans, width="stretch", hide_index=True)
-
-    # Filter for min games for rate stats
-    min_games = 18
-    rate_stats = stats[stats["picks"] >= min_games]
+        st.dataframe(summary["top_bans"], width="stretch", hide_index=True)
 
     col3, col4 = st.columns(2)
 
     with col3:
-        st.markdown(f"### Highest Win Rate (Min {min_games} Games)")
-        if not rate_stats.empty:
-            top_wins = rate_stats.nlargest(10, "win_rate")[["champion", "win_rate", "picks", "wins", "losses"]]
-            # Format rate
-            top_wins["win_rate"] = top_wins["win_rate"].map("{:.1f}%".format)
-            st.dataframe(top_wins, width="stretch", hide_index=True)
+        st.markdown(f"### Highest Win Rate (Min {MIN_RATE_GAMES} Games)")
+        if summary["top_win"] is not None:
+            st.dataframe(summary["top_win"], width="stretch", hide_index=True)
         else:
-            st.info(f"No champions with >= {min_games} games.")
+            st.info(f"No champions with >= {MIN_RATE_GAMES} games.")
 
     with col4:
-        st.markdown(f"### Highest Loss Rate (Min {min_games} Games)")
-        if not rate_stats.empty:
-            top_losses = rate_stats.nlargest(10, "loss_rate")[["champion", "loss_rate", "picks", "wins", "losses"]]
-            # Format rate
-            top_losses["loss_rate"] = top_losses["loss_rate"].map("{:.1f}%".format)
-            st.dataframe(top_losses, width="stretch", hide_index=True)
+        st.markdown(f"### Highest Loss Rate (Min {MIN_RATE_GAMES} Games)")
+        if summary["top_loss"] is not None:
+            st.dataframe(summary["top_loss"], width="stretch", hide_index=True)
         else:
-            st.info(f"No champions with >= {min_games} games.")
-
-
-def _render_game_analysis(team_df: pd.DataFrame):
+            st.info(f"No champions with >= {MIN_RATE_GAMES} games.")
+
+
+# Chart builders take the small aggregated inputs so unchanged filters reuse the figure.
+@st.cache_data(show_spinner=False)
+def _side_win_rate_chart(side_wins: pd.DataFrame) -> go.Figure:
+    fig_side = px.pie(
+        side_wins, 
+        names="side", 
+        values="result", 
+        color="side",
+        title="Win Rate by Side (%)",
+        color_discrete_map={"Blue": CHART_COLORS.get("blue_side", "blue"), "Red": CHART_COLORS.get("red_side", "red")},
+        hole=0.4
+    )
+    fig_side.update_traces(textposition='inside', textinfo='percent+label', texttemplate='%{label}<br>%{percent:.2%}')
+    return fig_side
+
+
+@st.cache_data(show_spinner=False)
+def _duration_chart(durations: pd.Series) -> go.Figure:
+    fig_duration = px.histogram(
+        durations, 
+        nbins=20, 
+        title="Game Duration (Minutes)",
+        labels={"value": "Minutes"},
+        color_discrete_sequence=[CHART_COLORS.get("primary", "blue")]
+    )
+    fig_duration.update_layout(showlegend=False)
+    return fig_duration
+
+
+@st.cache_data(show_spinner=False)
+def _objective_win_rate_chart(obj_df: pd.DataFrame) -> go.Figure:
+    return px.bar(
+        obj_df,
+        x="Objective",
+        y="Win Rate",
+        title="Win Rate when Securing First Objective (%)",
+        color="Win Rate",
+        color_continuous_scale="Viridis"
+    )
+
+
+def _render_game_analysis(summary: Dict[str, Any]):
     st.subheader("Game Analysis (Team Data)")
-    
-    if team_df.empty:
-        return
 
     # Side Win Rate
-    if "side" in team_df.columns and "result" in team_df.columns:
+    if summary["side_wr"] is not None:
         st.markdown("### Side Win Rate")
-        side_wins = team_df.groupby("side")["result"].mean().reset_index()
-        side_wins["result"] = side_wins["result"] * 100
-        
-        fig_side = px.pie(
-            side_wins, 
-            names="side", 
-            values="result", 
-            color="side",
-            title="Win Rate by Side (%)",
-            color_discrete_map={"Blue": CHART_COLORS.get("blue_side", "blue"), "Red": CHART_COLORS.get("red_side", "red")},
-            hole=0.4
-        )
-        fig_side.update_traces(textposition='inside', textinfo='percent+label', texttemplate='%{label}<br>%{percent:.2%}')
-        st.plotly_chart(fig_side, use_container_width=True)
+        st.plotly_chart(_side_win_rate_chart(summary["side_wr"]), use_container_width=True)
 
     col1, col2 = st.columns(2)
 
     # Game Duration
     with col1:
-        if "gamelength" in team_df.columns:
+        if summary["durations"] is not None:
             st.markdown("### Game Duration Distribution")
-            # Convert seconds to minutes for better readability
-            durations = team_df["gamelength"] / 60
-            fig_duration = px.histogram(
-                durations, 
-                nbins=20, 
-                title="Game Duration (Minutes)",
-                labels={"value": "Minutes"},
-                color_discrete_sequence=[CHART_COLORS.get("primary", "blue")]
-            )
-            fig_duration.update_layout(showlegend=False)
-            st.plotly_chart(fig_duration, use_container_width=True)
+            st.plotly_chart(_duration_chart(summary["durations"]), use_container_width=True)
 
     # First Objectives Win Rate
     with col2:
         st.markdown("### First Objective Win Rates")
-        objectives = ["firstblood", "firstdragon", "firstbaron", "firsttower", "firstherald"]
-        obj_data = []
-        
-        for obj in objectives:
-            if obj in team_df.columns and "result" in team_df.columns:
-                # Calculate win rate when securing the objective (value == 1)
-                subset = team_df[team_df[obj] == 1]
-                if not subset.empty:
-                    win_rate = subset["result"].mean() * 100
-                    obj_data.append({"Objective": obj, "Win Rate": win_rate})
-        
-        if obj_data:
-            obj_df = pd.DataFrame(obj_data)
-            fig_obj = px.bar(
-                obj_df,
-                x="Objective",
-                y="Win Rate",
-                title="Win Rate when Securing First Objective (%)",
-                color="Win Rate",
-                color_continuous_scale="Viridis"
-            )
-            st.plotly_chart(fig_obj, use_container_width=True)
+        if not summary["obj_wr"].empty:
+            st.plotly_chart(_objective_win_rate_chart(summary["obj_wr"]), use_container_width=True)
 
 
 def render_page():
+    st.set_page_config(layout="wide")
     st.header("Exploratory Data Analysis")
 
-    df_players, df_teams = load_data()
-    
-    # Apply filters to both datasets
-    filters = _get_active_filters(df_players)
-    filtered_teams = apply_filters(df_teams, filters)
+    filtered_teams, filter_key = load_selection("teams")
 
     st.caption("Global filters applied. Analysis based on Team Data.")
     
@@ -196,17 +205,19 @@ def render_page():
         st.warning("No data available with current filters.")
         return
 
-    _render_champion_analysis(filtered_teams)
+    summary = _build_page_summary(filter_key)
+    _render_champion_analysis(summary)
     st.divider()
-    _render_game_analysis(filtered_teams)
+    _render_game_analysis(summary)
 
     # Debug section in expander
     with st.expander("🔧 Debug Info", expanded=False):
         if st.checkbox("Show Filter State", value=False):
-            st.json(filters)
+            st.json(dict(filter_key))
             st.write("Filtered Teams shape:", filtered_teams.shape)
 
     return filtered_teams
 
 
-filtered_players_df = render_page()
+if __name__ == "__main__":
+    render_page()
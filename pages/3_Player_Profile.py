@@ -2,220 +2,27 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
-
 import pandas as pd
 import plotly.express as px
 import streamlit as st
 
 
-from components.sidebar import render_sidebar_filters
 from config.colors import CHART_COLORS
-from components.data_loader import load_data
-from components.utils import apply_filters
-from sklearn.decomposition import PCA
-from sklearn.preprocessing import StandardScaler
-from scipy.stats import percentileofscore
-import os
-
-st.set_page_config(layout="wide")
-
-
-def _load_filtered_players() -> pd.DataFrame:
-    df_players, _ = load_data()
-    filters = render_sidebar_filters(df_players)
-    return apply_filters(df_players, filters)
-
-
-def _get_player_metrics(player_data: pd.DataFrame) -> Dict[str, float]:
-    """Extract and calculate average metrics for a player."""
-    metrics = {}
-    
-    # KDA is already computed in data_loader
-    if "KDA" in player_data.columns:
-        metrics["KDA"] = pd.to_numeric(player_data["KDA"], errors="coerce").mean()
-    
-    # DPM - Damage Per Minute
-    dpm_col = None
-    for col in player_data.columns:
-        if col.lower() == "dpm":
-            dpm_col = col
-            break
-    if dpm_col:
-        metrics["DPM"] = pd.to_numeric(player_data[dpm_col], errors="coerce").mean()
-    
-    # GPM - Gold Per Minute (check for 'gpm' or 'earned gpm')
-    gpm_col = None
-    for col in player_data.columns:
-        if "gpm" in col.lower():
-            gpm_col = col
-            break
-    if gpm_col:
-        metrics["GPM"] = pd.to_numeric(player_data[gpm_col], errors="coerce").mean()
-    
-    # VSPM - Vision Score Per Minute
-    vspm_col = None
-    for col in player_data.columns:
-        if col.lower() == "vspm":
-            vspm_col = col
-            break
-    if vspm_col:
-        metrics["VSPM"] = pd.to_numeric(player_data[vspm_col], errors="coerce").mean()
-    
-    # Fill missing values with 0
-    for key in ["KDA", "DPM", "GPM", "VSPM"]:
-        if key not in metrics or pd.isna(metrics[key]):
-            metrics[key] = 0.0
-    
-    return metrics
-
-
-def _load_cluster_info() -> pd.DataFrame:
-    """Load cluster definitions from csv."""
-    # Using data/val.csv as requested
-    file_path = os.path.join("data", "val.csv")
-    if not os.path.exists(file_path):
-        st.error(f"Cluster data not found at {file_path}")
-        return pd.DataFrame()
-    
-    # The new format has a header like ",0" and rows like "variable,Factor X"
-    # We'll read it without header first to inspect or just skip first row if we know format
-    # Based on user description: "Factor 1, ..."
-    # Actually, the file content snippet showed:
-    # ,0
-    # kills,Factor 2
-    # ...
-    
-    try:
-        df = pd.read_csv(file_path)
-        # Rename columns to standard names
-        # Expecting the first column to be variable and second to be the factor string
-        if len(df.columns) >= 2:
-            df.columns = ['variable', 'cluster_label'] + list(df.columns[2:])
-            
-            # Extract cluster ID from "Factor X"
-            # We use regex to extract the number
-            df['cluster'] = df['cluster_label'].astype(str).str.extract(r'(\d+)').astype(float)
-            
-            return df
-    except Exception as e:
-        st.error(f"Error loading cluster data: {e}")
-        return pd.DataFrame()
-    
-    return df
-
-
-from factor_analyzer import FactorAnalyzer
-
-def _calculate_factor_scores(player_name: str, position: str, full_data: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
-    """
-    Calculate Factor scores for the player based on clusters, relative to their position.
-    Returns a dict: {cluster_id: {'name': str, 'score': float, 'vars': list}}
-    """
-    cluster_df = _load_cluster_info()
-    if cluster_df.empty:
-        return {}
-
-    # Filter data for the same position
-    position_data = full_data[full_data['position'] == position].reset_index(drop=True).copy()
-
-    # Get player's position
-    player_row = position_data[position_data['playername'] == player_name]
-    if player_row.empty:
-        return {}
-    
-    # If not enough data for analysis, return empty
-    if len(position_data) < 3:
-        return {}
-
-    # Cluster mapping (Updated to 8 Factors)
-    cluster_names = {
-        1: '성장 기반 운영력 (Resource & Vision Baseline)',
-        2: '후반 캐리 및 공성력 (Late-Game Carry & Siege)',
-        3: '팀파이트 및 지원 능력 (Teamfight & Support)',
-        4: '라인전 압도 지수 (Laning Phase Dominance)',
-        5: '사망 기여 및 위험도 (Mortality & Risk)',
-        6: '방어/전선 유지 및 중립 오브젝트 (Frontline & Objective)',
-        7: '공격적 주도권 (Aggressive Initiative)',
-        8: '상대팀 전투 우위 (Enemy Combat Advantage)'
-    }
-    
-    results = {}
-    
-    # Loop through 8 factors
-    for cluster_id in range(1, 9):
-        # Get variables for this cluster
-        vars_in_cluster = cluster_df[cluster_df['cluster'] == cluster_id]['variable'].tolist()
-        
-        # Filter variables that exist in the data
-        valid_vars = [v for v in vars_in_cluster if v in position_data.columns]
-        
-        if not valid_vars:
-            results[cluster_id] = {
-                'name': cluster_names.get(cluster_id, str(cluster_id)),
-                'score': 0.0,
-                'vars': []
-            }
-            continue
-            
-        # Prepare data
-        X = position_data[valid_vars].fillna(0)
-        
-        # Standardize
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        # Calculate scores
-        scores = None
-        
-        # If only 1 variable, use it directly (standardized)
-        if X.shape[1] == 1:
-            scores = X_scaled
-        else:
-            try:
-                # Use Factor Analysis
-                # n_factors=1 to get a single composite score for the cluster
-                fa = FactorAnalyzer(n_factors=1, rotation=None)
-                fa.fit(X_scaled)
-                scores = fa.transform(X_scaled)
-            except Exception as e:
-                # Fallback to PCA if FA fails (e.g. singular matrix, too few vars)
-                # st.warning(f"FA failed for cluster {cluster_id}, falling back to PCA: {e}")
-                try:
-                    pca = PCA(n_components=1)
-                    scores = pca.fit_transform(X_scaled)
-                except:
-                    # Fallback to mean if PCA also fails
-                    scores = X_scaled.mean(axis=1).reshape(-1, 1)
-
-        # Check direction: if correlation between component and sum of variables is negative, flip it
-        # This ensures "more stats" = "higher score"
-        if pd.Series(scores.flatten()).corr(X.sum(axis=1).reset_index(drop=True)) < 0:
-            scores = -scores
-            
-        # Get score for the specific player
-        # We need to find the index of the player in the position_data
-        player_idx = position_data.index.get_loc(player_row.index[0])
-        player_score = scores[player_row.index].mean()
-        # Calculate percentile
-        # percentile = percentileofscore(scores.flatten(), player_score)
-        percentile = 50 + (player_score - scores.mean()) / scores.std() * 10
-        percnet = (percentile-20) / 60 * 100
-        
-        results[cluster_id] = {
-            'name': cluster_names.get(cluster_id, str(cluster_id)),
-            'score': percentile,
-            'vars': valid_vars,
-            'percent': percnet,
-        }
-        
-    return results
+from components.data_loader import sorted_unique
+from components.selection import load_selection
+from components.player_metrics import (
+    MOST_CHAMPS_COLUMNS,
+    calculate_factor_scores,
+    player_id_column,
+    player_rows,
+)
 
 
 def render_page() -> pd.DataFrame:
+    st.set_page_config(layout="wide")
     # st.header("Player Profile")
     
-    filtered_df = _load_filtered_players()
+    filtered_df, filter_key = load_selection("players")
     st.caption("현재 글로벌 필터를 반영한 플레이어 데이터입니다.")
     
     if filtered_df.empty:
@@ -223,25 +30,19 @@ def render_page() -> pd.DataFrame:
         return filtered_df
     
     # Get unique player IDs
-    # player_id_col = None
-    # for col in filtered_df.columns:
-    #     if col.lower() in ["playerid", "playername", "participantid"]:
-    #         break
-    player_id_col = 'playername'
+    player_id_col = player_id_column(filtered_df)
     
     if player_id_col is None:
         st.error("플레이어 ID 컬럼을 찾을 수 없습니다.")
         return filtered_df
     
-    unique_players = filtered_df[player_id_col].dropna().unique().tolist()
+    # Sorted for better UX; categorical names only sort their observed categories
+    unique_players = sorted_unique(filtered_df[player_id_col])
     
     if not unique_players:
         st.warning("선택할 플레이어가 없습니다.")
         return filtered_df
     
-    # Sort players for better UX
-    unique_players = sorted(unique_players, key=str)
-    
     # Determine the index of the previously selected player if possible
     index = 0
     if "player_profile_selector" in st.session_state:
@@ -261,8 +62,8 @@ def render_page() -> pd.DataFrame:
         st.info("플레이어를 선택해 주세요.")
         return filtered_df
     
-    # Filter data for selected player
-    player_data = filtered_df[filtered_df[player_id_col] == selected_player].copy()
+    # Filter data for selected player by its precomputed row positions
+    player_data = filtered_df.take(player_rows(filter_key, player_id_col).get(selected_player, []))
     
     if player_data.empty:
         st.warning(f"{selected_player} 플레이어의 데이터가 없습니다.")
@@ -289,8 +90,7 @@ def render_page() -> pd.DataFrame:
         
         # Win Rate
         if "result" in player_data.columns:
-            wins = pd.to_numeric(player_data["result"], errors="coerce")
-            win_count = wins.sum() if not wins.isna().all() else 0
+            win_count = player_data["result"].sum()
             win_rate = (win_count / total_games * 100) if total_games > 0 else 0
             col4.metric("승률", f"{win_rate:.1f}%")
     
@@ -301,7 +101,7 @@ def render_page() -> pd.DataFrame:
     
     # Calculate scores using the FULL dataset (filtered_df contains all players)
     # We need to pass the full dataset to calculate the distribution for the position
-    pca_scores = _calculate_factor_scores(selected_player, position, filtered_df)
+    pca_scores = calculate_factor_scores(selected_player, position, filtered_df, filter_key, player_id_col)
     st.caption("사망 기여 및 위험도 & 상대팀 전투 우위는 Negative지표입니다.")
     
     if pca_scores:
@@ -339,9 +139,9 @@ def render_page() -> pd.DataFrame:
     
     if not player_data.empty:
         # Calculate stats per champion
-        champ_stats = player_data.groupby("champion").agg(
+        champ_stats = player_data[list(MOST_CHAMPS_COLUMNS)].groupby("champion", observed=True).agg(
             gameplay=("champion", "count"),
-            win_rate=("result", lambda x: pd.to_numeric(x, errors="coerce").mean() * 100),
+            win_rate=("result", "mean"),
             kda=("KDA", "mean"),
             gd10=("golddiffat10", "mean"),
             gd15=("golddiffat15", "mean"),
@@ -351,6 +151,7 @@ def render_page() -> pd.DataFrame:
             dpm=("dpm", "mean"),
             visionscore=("visionscore", "mean"),
         ).reset_index()
+        champ_stats["win_rate"] *= 100
         
         # Sort by gameplay descending and take top 5
         most_5 = champ_stats.sort_values("gameplay", ascending=False).head(5)
@@ -401,5 +202,5 @@ def render_page() -> pd.DataFrame:
     return filtered_df
 
 
-filtered_players_df = render_page()
-
+if __name__ == "__main__":
+    render_page()
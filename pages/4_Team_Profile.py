@@ -2,81 +2,79 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Mapping, NamedTuple, Optional, Tuple
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
 import streamlit as st
 
 from components.charts import create_radar_chart
-from components.sidebar import render_sidebar_filters
 from config.colors import CHART_COLORS
-from components.data_loader import load_data
-from components.utils import apply_filters
-
-st.set_page_config(layout="wide")
-
+from components.data_loader import load_filtered, sorted_unique
+from components.selection import load_selection
+from components.utils import FilterKey
+
+LANING_TIMES: Tuple[int, ...] = (10, 15, 20, 25)
+# The small laning line charts need no plotly mode bar
+LANING_CHART_CONFIG: Dict[str, Any] = {"displayModeBar": False}
+
+
+class TeamColumns(NamedTuple):
+    """Actual column names for the stats the page reads; ``None`` when absent."""
+
+    team_name: Optional[str]
+    kills: Optional[str]
+    deaths: Optional[str]
+    assists: Optional[str]
+    dpm: Optional[str]
+    gpm: Optional[str]
+    vspm: Optional[str]
+
+
+@lru_cache(maxsize=1)
+def _resolve_columns(columns: Tuple[str, ...]) -> TeamColumns:
+    """Resolve every column the page needs in one pass over ``columns``.
+
+    Names match case-insensitively (first spelling wins); the team name, DPM and
+    Earned GPM fall back to substring matches when there is no exact name.
+    """
+    col_map: Dict[str, str] = {}
+    for col in columns:
+        col_map.setdefault(col.lower(), col)
+
+    def find(key: str, fallback=None) -> Optional[str]:
+        if key in col_map:
+            return col_map[key]
+        return next((col for lower, col in col_map.items() if fallback(lower)), None) if fallback else None
+
+    return TeamColumns(
+        team_name=find("teamname", lambda lower: "teamname" in lower or ("team" in lower and "name" in lower)),
+        kills=find("kills"),
+        deaths=find("deaths"),
+        assists=find("assists"),
+        dpm=find("dpm", lambda lower: "team" in lower and "dpm" in lower),
+        gpm=find("earned gpm", lambda lower: "earned gpm" in lower),
+        vspm=find("vspm"),
+    )
 
-def _load_filtered_teams() -> pd.DataFrame:
-    _, df_teams = load_data()
-    filters = render_sidebar_filters(df_teams)
-    return apply_filters(df_teams, filters)
 
+def _metric_columns(columns, cols: TeamColumns) -> Tuple[Dict[str, Tuple[str, float]], list]:
+    """Averaged metrics as ``label -> (column, scale)``, plus the KDA source columns if all exist."""
+    kda_cols = [cols.kills, cols.deaths, cols.assists] if cols.kills and cols.deaths and cols.assists else []
 
-def _get_team_metrics(team_data: pd.DataFrame) -> Dict[str, float]:
-    """Extract and calculate average metrics for a team."""
-    metrics = {}
-    
-    # Basic averages
-    metrics["Games"] = len(team_data)
-    
-    if "result" in team_data.columns:
-        metrics["Win Rate"] = team_data["result"].mean() * 100
-    
-    # KDA - Calculate as (Sum Kills + Sum Assists) / Sum Deaths
-    # We use case-insensitive lookup for safety
-    kills_col = next((c for c in team_data.columns if c.lower() == "kills"), None)
-    deaths_col = next((c for c in team_data.columns if c.lower() == "deaths"), None)
-    assists_col = next((c for c in team_data.columns if c.lower() == "assists"), None)
-
-    if kills_col and deaths_col and assists_col:
-        t_kills = pd.to_numeric(team_data[kills_col], errors="coerce").sum()
-        t_deaths = pd.to_numeric(team_data[deaths_col], errors="coerce").sum()
-        t_assists = pd.to_numeric(team_data[assists_col], errors="coerce").sum()
-        
-        metrics["KDA"] = (t_kills + t_assists) / t_deaths if t_deaths > 0 else 0.0
-    elif "KDA" in team_data.columns:
+    # Averaged metrics: label -> (column, scale)
+    mean_metrics: Dict[str, Tuple[str, float]] = {}
+    if "result" in columns:
+        mean_metrics["Win Rate"] = ("result", 100)
+    if not kda_cols and "KDA" in columns:
         # Fallback to average if raw columns missing
-        metrics["KDA"] = pd.to_numeric(team_data["KDA"], errors="coerce").mean()
-    else:
-        metrics["KDA"] = 0.0
-    
-    # DPM
-    dpm_col = None
-    for col in team_data.columns:
-        if col.lower() == "dpm" or "team" in col.lower() and "dpm" in col.lower():
-            dpm_col = col
-            break
-    if dpm_col:
-        metrics["DPM"] = pd.to_numeric(team_data[dpm_col], errors="coerce").mean()
-    
-    # Earned GPM
-    gpm_col = None
-    for col in team_data.columns:
-        if "earned gpm" in col.lower():
-            gpm_col = col
-            break
-    if gpm_col:
-        metrics["Earned GPM"] = pd.to_numeric(team_data[gpm_col], errors="coerce").mean()
-    
-    # VSPM
-    vspm_col = None
-    for col in team_data.columns:
-        if col.lower() == "vspm":
-            vspm_col = col
-            break
-    if vspm_col:
-        metrics["VSPM"] = pd.to_numeric(team_data[vspm_col], errors="coerce").mean()
+        mean_metrics["KDA"] = ("KDA", 1)
+    
+    for name, col in [("DPM", cols.dpm), ("Earned GPM", cols.gpm), ("VSPM", cols.vspm)]:
+        if col:
+            mean_metrics[name] = (col, 1)
 
     # Objectives (Mean)
     for col, name in [
@@ -86,8 +84,8 @@ def _get_team_metrics(team_data: pd.DataFrame) -> Dict[str, float]:
         ("barons", "Barons"),
         ("void_grubs", "Void Grubs"),
     ]:
-        if col in team_data.columns:
-            metrics[name] = pd.to_numeric(team_data[col], errors="coerce").mean()
+        if col in columns:
+            mean_metrics[name] = (col, 1)
 
     # First Objectives (%)
     for col, name in [
@@ -97,25 +95,131 @@ def _get_team_metrics(team_data: pd.DataFrame) -> Dict[str, float]:
         ("firstbaron", "First Baron"),
         ("atakhans", "Atakhans"), # Assuming atakhans is a binary/count column where mean represents rate
     ]:
-        if col in team_data.columns:
-             metrics[name] = pd.to_numeric(team_data[col], errors="coerce").mean() * 100
+        if col in columns:
+            mean_metrics[name] = (col, 100)
+
+    return mean_metrics, kda_cols
+
+
+# Metrics are cached on the sidebar selection rather than the frame, so reruns
+# from the team selector or debug toggles never rehash or rescan the rows.
+@st.cache_data(show_spinner=False)
+def _all_team_metrics(filter_key: FilterKey, cols: TeamColumns) -> pd.DataFrame:
+    """Average metrics of every team under the selected filters, in one groupby.
+
+    Returns:
+        One row per team (indexed by team name): ``Games``, the ``_metric_columns``
+        labels scaled as listed there, and ``KDA`` as (sum kills + sum assists) /
+        sum deaths. Switching teams is a ``.loc`` lookup.
+    """
+    league_data = load_filtered("teams", dict(filter_key))
+    mean_metrics, kda_cols = _metric_columns(league_data.columns, cols)
 
-    return metrics
+    num_cols = list(dict.fromkeys([*kda_cols, *(col for col, _ in mean_metrics.values())]))
+    grouped = league_data[num_cols].groupby(league_data[cols.team_name], observed=True)
+    means = grouped.mean()
 
+    table = pd.DataFrame({"Games": grouped.size()})
+    for name, (col, scale) in mean_metrics.items():
+        table[name] = means[col] * scale
+
+    # KDA - Calculate as (Sum Kills + Sum Assists) / Sum Deaths
+    if kda_cols:
+        sums = grouped[kda_cols].sum()
+        t_kills, t_deaths, t_assists = (sums[col] for col in kda_cols)
+        table["KDA"] = ((t_kills + t_assists) / t_deaths).where(t_deaths > 0, 0.0)
+    elif "KDA" not in table.columns:
+        table["KDA"] = 0.0
+
+    return table
+
+
+@st.cache_data(show_spinner=False)
+def _team_options(filter_key: FilterKey, team_name_col: str) -> list:
+    """Sorted team names under the selected filters, for the team selector."""
+    return sorted_unique(load_filtered("teams", dict(filter_key))[team_name_col])
+
+
+@st.cache_data(show_spinner=False)
+def _team_rows(filter_key: FilterKey, team_name_col: str) -> Dict[Any, np.ndarray]:
+    """Row positions of every team under the selected filters, built in one groupby pass."""
+    return load_filtered("teams", dict(filter_key)).groupby(team_name_col, observed=True).indices
+
+
+def _kda_parts(df: pd.DataFrame) -> pd.DataFrame:
+    """Per-game kills, deaths and assists; without a deaths column each game counts one death."""
+    return pd.DataFrame(
+        {
+            "kills": df.get("kills", 0),
+            "deaths": df.get("deaths", 1),
+            "assists": df.get("assists", 0),
+        },
+        index=df.index,
+    )
+
+
+def _laning_times(columns) -> list:
+    """Laning time points with both a gold and a CS diff column."""
+    return [t for t in LANING_TIMES if f"golddiffat{t}" in columns and f"csdiffat{t}" in columns]
+
+
+@st.cache_data(show_spinner=False)
+def _league_aggregates(
+    filter_key: FilterKey, cols: TeamColumns
+) -> Tuple[pd.DataFrame, pd.Series]:
+    """Per-team and league-wide aggregates read by the radar and laning charts.
+
+    Built once per sidebar selection, so switching teams only slices the selected
+    team's rows instead of rescanning the league.
+
+    Returns:
+        ``(team_agg, league)``. ``team_agg`` has one row per team with the mean of
+        every radar metric column and the team ``KDA``; without a team column it
+        falls back to one row per game and no ``KDA``. ``league`` holds the game
+        mean of each metric column, the league ``KDA`` and the adjusted absolute
+        laning diffs (``sum(abs) / (2 * len)``), keyed by column name.
+    """
+    league_data = load_filtered("teams", dict(filter_key))
+    metric_cols = [col for col in (cols.dpm, cols.gpm, cols.vspm) if col]
+    diff_cols = [f"{stat}diffat{t}" for stat in ("gold", "cs") for t in _laning_times(league_data.columns)]
+
+    parts = _kda_parts(league_data)
+    l_kills, l_deaths, l_assists = parts.sum()
+    league = pd.concat([
+        league_data[metric_cols].mean(),
+        pd.Series({"KDA": (l_kills + l_assists) / l_deaths if l_deaths > 0 else 0}),
+        league_data[diff_cols].abs().sum() / (2 * len(league_data)),
+    ])
+
+    if cols.team_name:
+        # Team averages, so the radar compares "Team Avg" vs "Best/Worst Team Avg"
+        team_agg = (
+            pd.concat([league_data[metric_cols], parts.astype(float)], axis=1)
+            .groupby(league_data[cols.team_name], observed=True)
+            .agg({**{col: "mean" for col in metric_cols}, "kills": "sum", "deaths": "sum", "assists": "sum"})
+        )
+        # Deaths are summed before guarding, so only a team with no deaths at all divides by 1
+        team_agg["KDA"] = (team_agg["kills"] + team_agg["assists"]) / team_agg["deaths"].replace(0, 1)
+        team_agg = team_agg.drop(columns=["kills", "deaths", "assists"])
+    else:
+        team_agg = league_data[metric_cols]
+    return team_agg, league
 
-def _get_league_metrics(df_teams: pd.DataFrame) -> Dict[str, float]:
-    """Calculate league-wide average metrics."""
-    return _get_team_metrics(df_teams)
 
+def _create_normalized_radar_chart(
+    team_metrics: Mapping[str, float], team_agg: pd.DataFrame, league: pd.Series, team_name: str, cols: TeamColumns
+):
+    """Create a normalized radar chart comparing team to league.
 
-def _create_normalized_radar_chart(team_data: pd.DataFrame, league_data: pd.DataFrame, team_name: str):
-    """Create a normalized radar chart comparing team to league."""
+    Team values are read from ``team_metrics`` (the team's ``_all_team_metrics``
+    row shown above the chart), so the team's rows are not reduced a second time.
+    """
     
     metrics_to_plot = {
-        "DPM": "dpm",
-        "Earned GPM": "earned gpm", 
+        "DPM": cols.dpm,
+        "Earned GPM": cols.gpm, 
         "KDA": "KDA",
-        "VSPM": "vspm"
+        "VSPM": cols.vspm
     }
     
     team_vals = {}
@@ -123,79 +227,22 @@ def _create_normalized_radar_chart(team_data: pd.DataFrame, league_data: pd.Data
     max_vals = {}
     min_vals = {}
     
-    # Calculate averages and find min/max for normalization
-    # First, aggregate league data by team to get team-level averages for min/max
-    # This ensures we compare "Team Avg" vs "Best/Worst Team Avg", not "Best/Worst Game"
-    team_name_col = next((col for col in league_data.columns if "teamname" in col.lower() or "team" in col.lower() and "name" in col.lower()), None)
-    
-    league_team_means = pd.DataFrame()
-    if team_name_col:
-        # We only care about the numeric columns we are plotting
-        cols_to_agg = []
-        for col_key in metrics_to_plot.values():
-             for col in league_data.columns:
-                if col_key.lower() == col.lower() or (col_key.lower() in col.lower() and len(col) < len(col_key) + 5):
-                     cols_to_agg.append(col)
-                     break
-        
-        if cols_to_agg:
-             # Group by team and calculate mean for relevant columns
-             league_team_means = league_data.groupby(team_name_col)[cols_to_agg].mean()
-
-    for label, col_key in metrics_to_plot.items():
-        # Special handling for KDA to ensure (kills + assists) / deaths
-        if label == "KDA":
-            # Calculate Team KDA
-            t_kills = pd.to_numeric(team_data.get("kills", 0), errors="coerce").sum()
-            t_deaths = pd.to_numeric(team_data.get("deaths", 0), errors="coerce").replace(0, 1).sum()
-            t_assists = pd.to_numeric(team_data.get("assists", 0), errors="coerce").sum()
-            team_mean = (t_kills + t_assists) / t_deaths if t_deaths > 0 else 0
-            
-            # Calculate League KDA (Macro average of all games)
-            l_kills = pd.to_numeric(league_data.get("kills", 0), errors="coerce").sum()
-            l_deaths = pd.to_numeric(league_data.get("deaths", 0), errors="coerce").replace(0, 1).sum()
-            l_assists = pd.to_numeric(league_data.get("assists", 0), errors="coerce").sum()
-            league_mean = (l_kills + l_assists) / l_deaths if l_deaths > 0 else 0
-            
-            # For min/max, we calculate KDA for EACH TEAM and take min/max of those averages
-            if team_name_col:
-                # Calculate KDA per team
-                team_kdas = []
-                for team in league_data[team_name_col].unique():
-                    td = league_data[league_data[team_name_col] == team]
-                    tk = pd.to_numeric(td.get("kills", 0), errors="coerce").sum()
-                    t_d = pd.to_numeric(td.get("deaths", 0), errors="coerce").replace(0, 1).sum()
-                    ta = pd.to_numeric(td.get("assists", 0), errors="coerce").sum()
-                    team_kdas.append((tk + ta) / t_d)
-                
-                league_max = max(team_kdas) if team_kdas else league_mean * 2
-                league_min = min(team_kdas) if team_kdas else 0
-            else:
-                league_max = league_mean * 2
-                league_min = 0
-                
+    # Team values come from the metric cards; league means and the team-average
+    # min/max used for normalization come from the per-selection aggregates
+    for label, col_name in metrics_to_plot.items():
+        # Skip metrics whose column is missing
+        if not col_name or label not in team_metrics:
+            continue
+        team_mean = team_metrics[label]
+
+        league_mean = league[col_name]
+        # Min/max over the team averages; KDA needs a team column to have any
+        if col_name in team_agg.columns and not team_agg.empty:
+            league_max = team_agg[col_name].max()
+            league_min = team_agg[col_name].min()
         else:
-            # Find actual column name for other metrics
-            col_name = None
-            for col in team_data.columns:
-                if col_key.lower() == col.lower() or (col_key.lower() in col.lower() and len(col) < len(col_key) + 5):
-                     col_name = col
-                     break
-            
-            if not col_name:
-                continue
-                
-            team_mean = pd.to_numeric(team_data[col_name], errors="coerce").mean()
-            league_mean = pd.to_numeric(league_data[col_name], errors="coerce").mean()
-            
-            # Use pre-calculated team means for min/max if available
-            if not league_team_means.empty and col_name in league_team_means.columns:
-                league_max = league_team_means[col_name].max()
-                league_min = league_team_means[col_name].min()
-            else:
-                # Fallback to game-level min/max (less ideal)
-                league_max = pd.to_numeric(league_data[col_name], errors="coerce").max()
-                league_min = pd.to_numeric(league_data[col_name], errors="coerce").min()
+            league_max = league_mean * 2
+            league_min = 0
         
         team_vals[label] = team_mean
         league_vals[label] = league_mean
@@ -206,23 +253,17 @@ def _create_normalized_radar_chart(team_data: pd.DataFrame, league_data: pd.Data
         st.warning("레이더 차트를 위한 데이터가 부족합니다.")
         return None
 
-    # Normalize
+    # Normalize every metric at once onto the worst..best team range (0.5 when flat)
     categories = list(team_vals.keys())
-    team_norm = []
-    league_norm = []
-    
-    for cat in categories:
-        mn = min_vals[cat]
-        mx = max_vals[cat]
-        if mx == mn:
-            team_norm.append(0.5)
-            league_norm.append(0.5)
-        else:
-            team_norm.append((team_vals[cat] - mn) / (mx - mn))
-            league_norm.append((league_vals[cat] - mn) / (mx - mn))
+    team_arr = np.fromiter(team_vals.values(), dtype=np.float64, count=len(categories))
+    league_arr = np.fromiter(league_vals.values(), dtype=np.float64, count=len(categories))
+    mn = np.fromiter(min_vals.values(), dtype=np.float64, count=len(categories))
+    mx = np.fromiter(max_vals.values(), dtype=np.float64, count=len(categories))
+    flat = mx == mn
+    span = np.where(flat, 1.0, mx - mn)
+    team_norm = np.where(flat, 0.5, (team_arr - mn) / span)
+    league_norm = np.where(flat, 0.5, (league_arr - mn) / span)
             
-    import plotly.graph_objects as go
-    
     fig = go.Figure()
     
     # League Average
@@ -260,89 +301,60 @@ def _create_normalized_radar_chart(team_data: pd.DataFrame, league_data: pd.Data
     
     return fig
 
-def _create_laning_phase_charts(team_data: pd.DataFrame, league_data: pd.DataFrame):
+def _laning_line_chart(
+    times: list, team_values: pd.Series, league_values: pd.Series, team_label: str, y_title: str
+):
+    """Team vs league line chart for one laning diff, built from two traces directly."""
+    fig = go.Figure([
+        go.Scatter(x=times, y=team_values.tolist(), mode="lines+markers", name=team_label),
+        go.Scatter(x=times, y=league_values.tolist(), mode="lines+markers", name="League Avg Diff (Adj)"),
+    ])
+    fig.update_layout(
+        xaxis_title="Time",
+        yaxis_title=y_title,
+        legend=dict(
+            yanchor="top",
+            y=0.99,
+            xanchor="left",
+            x=0.01,
+            bgcolor="rgba(0,0,0,0)"
+        )
+    )
+    return fig
+
+
+def _create_laning_phase_charts(team_data: pd.DataFrame, league: pd.Series):
     """Create charts for laning phase indicators (Gold/CS Diff)."""
     
-    time_points = [10, 15, 20, 25]
-    
-    # Gold Diff
-    gold_diff_cols = [f"golddiffat{t}" for t in time_points]
-    cs_diff_cols = [f"csdiffat{t}" for t in time_points]
-    
-    team_gold_diff = []
-    league_abs_gold_diff = []
-    
-    team_cs_diff = []
-    league_abs_cs_diff = []
-    
-    valid_times = []
-    
-    for i, t in enumerate(time_points):
-        g_col = gold_diff_cols[i]
-        c_col = cs_diff_cols[i]
-        
-        if g_col in team_data.columns and c_col in team_data.columns:
-            valid_times.append(t)
-            
-            # Team Average (Signed)
-            team_gold_diff.append(pd.to_numeric(team_data[g_col], errors="coerce").mean())
-            team_cs_diff.append(pd.to_numeric(team_data[c_col], errors="coerce").mean())
-            
-            # League Absolute Average (Adjusted: sum(abs) / (2 * len))
-            l_gold_vals = pd.to_numeric(league_data[g_col], errors="coerce")
-            l_cs_vals = pd.to_numeric(league_data[c_col], errors="coerce")
-            
-            league_abs_gold_diff.append(l_gold_vals.abs().sum() / (2 * len(l_gold_vals)))
-            league_abs_cs_diff.append(l_cs_vals.abs().sum() / (2 * len(l_cs_vals)))
-            
+    valid_times = _laning_times(team_data.columns)
     if not valid_times:
         st.info("라인전 지표 데이터가 없습니다.")
         return
 
-    # Create DataFrames for Plotly
-    df_gold = pd.DataFrame({
-        "Time": valid_times,
-        "Team Gold Diff": team_gold_diff,
-        "League Avg Diff (Adj)": league_abs_gold_diff
-    })
-    
-    df_cs = pd.DataFrame({
-        "Time": valid_times,
-        "Team CS Diff": team_cs_diff,
-        "League Avg Diff (Adj)": league_abs_cs_diff
-    })
-    
+    gold_diff_cols = [f"golddiffat{t}" for t in valid_times]
+    cs_diff_cols = [f"csdiffat{t}" for t in valid_times]
+    diff_cols = gold_diff_cols + cs_diff_cols
+
+    # Team Average (Signed), every column in one reduction
+    team_means = team_data[diff_cols].mean()
+    # League Absolute Average (Adjusted: sum(abs) / (2 * len)), precomputed per selection
+    league_abs = league[diff_cols]
+
     col1, col2 = st.columns(2)
     
     with col1:
         st.subheader("평균 골드 격차")
-        fig_gold = px.line(df_gold, x="Time", y=["Team Gold Diff", "League Avg Diff (Adj)"], markers=True)
-        fig_gold.update_layout(
-            yaxis_title="Gold Diff",
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor="rgba(0,0,0,0)"
-            )
+        fig_gold = _laning_line_chart(
+            valid_times, team_means[gold_diff_cols], league_abs[gold_diff_cols], "Team Gold Diff", "Gold Diff"
         )
-        st.plotly_chart(fig_gold, use_container_width=True)
+        st.plotly_chart(fig_gold, use_container_width=True, config=LANING_CHART_CONFIG)
         
     with col2:
         st.subheader("평균 CS 격차")
-        fig_cs = px.line(df_cs, x="Time", y=["Team CS Diff", "League Avg Diff (Adj)"], markers=True)
-        fig_cs.update_layout(
-            yaxis_title="CS Diff",
-            legend=dict(
-                yanchor="top",
-                y=0.99,
-                xanchor="left",
-                x=0.01,
-                bgcolor="rgba(0,0,0,0)"
-            )
+        fig_cs = _laning_line_chart(
+            valid_times, team_means[cs_diff_cols], league_abs[cs_diff_cols], "Team CS Diff", "CS Diff"
         )
-        st.plotly_chart(fig_cs, use_container_width=True)
+        st.plotly_chart(fig_cs, use_container_width=True, config=LANING_CHART_CONFIG)
 
 
 def _calculate_object_win_rates(team_data: pd.DataFrame):
@@ -360,17 +372,12 @@ def _calculate_object_win_rates(team_data: pd.DataFrame):
         "First Baron": "firstbaron"
     }
     
-    first_wr_data = {}
-    
-    for label, col in first_objs.items():
-        if col in team_data.columns:
-            # Filter games where team got the first objective (value == 1)
-            got_obj = team_data[team_data[col] == 1]
-            if not got_obj.empty:
-                wr = got_obj["result"].mean() * 100
-                first_wr_data[label] = wr
-            else:
-                first_wr_data[label] = 0.0
+    # Games where team got each first objective (value == 1), all objectives at once
+    got_obj = team_data[[col for col in first_objs.values() if col in team_data.columns]].eq(1)
+    games = got_obj.sum()
+    wins = got_obj.mul(team_data["result"], axis=0).sum()
+    win_rates = (wins / games * 100).where(games > 0, 0.0)
+    first_wr_data = {label: win_rates[col] for label, col in first_objs.items() if col in win_rates.index}
     
     # 2. Win Rate by Count (Voidgrubs, Dragon, Baron)
     count_objs = {
@@ -395,13 +402,18 @@ def _calculate_object_win_rates(team_data: pd.DataFrame):
     
     for i, (label, col) in enumerate(count_objs.items()):
         if col in team_data.columns:
-            # Ensure column is integer
-            team_data[col] = pd.to_numeric(team_data[col], errors='coerce').fillna(0).astype(int)
-            
-            # Group by count and calculate win rate
-            wr_by_count = team_data.groupby(col)["result"].agg(['mean', 'count']).reset_index()
-            wr_by_count.columns = [label, "Win Rate", "Games"]
-            wr_by_count["Win Rate"] = wr_by_count["Win Rate"] * 100
+            # Games and wins per objective count in one bincount each; the counts
+            # index the bins, so the table comes out ordered without a group sort
+            decided = team_data["result"].notna().to_numpy()
+            obj_counts = team_data[col].fillna(0).to_numpy(dtype=np.int8)[decided]
+            games = np.bincount(obj_counts)
+            wins = np.bincount(obj_counts, weights=team_data["result"].to_numpy(dtype=float)[decided])
+            played = np.flatnonzero(games)
+            wr_by_count = pd.DataFrame({
+                label: played,
+                "Win Rate": wins[played] / games[played] * 100,
+                "Games": games[played],
+            })
             
             with cols_map[i]:
                 st.write(f"**{label} 획득 수별 승률**")
@@ -419,9 +431,10 @@ def _calculate_object_win_rates(team_data: pd.DataFrame):
 
 
 def render_page() -> pd.DataFrame:
+    st.set_page_config(layout="wide")
     st.header("Team Profile")
     
-    filtered_df = _load_filtered_teams()
+    filtered_df, filter_key = load_selection("teams")
     st.caption("현재 글로벌 필터를 반영한 팀 데이터입니다.")
     
     if filtered_df.empty:
@@ -429,25 +442,20 @@ def render_page() -> pd.DataFrame:
         return filtered_df
     
     # Get unique team names
-    team_name_col = None
-    for col in filtered_df.columns:
-        if "teamname" in col.lower() or ("team" in col.lower() and "name" in col.lower()):
-            team_name_col = col
-            break
+    cols = _resolve_columns(tuple(filtered_df.columns))
+    team_name_col = cols.team_name
     
     if team_name_col is None:
         st.error("팀 이름 컬럼을 찾을 수 없습니다.")
         return filtered_df
     
-    unique_teams = filtered_df[team_name_col].dropna().unique().tolist()
+    # Sorted for better UX, once per sidebar selection
+    unique_teams = _team_options(filter_key, team_name_col)
     
     if not unique_teams:
         st.warning("선택할 팀이 없습니다.")
         return filtered_df
     
-    # Sort teams for better UX
-    unique_teams = sorted(unique_teams, key=str)
-    
     # Team selector
     selected_team = st.selectbox(
         "팀 선택",
@@ -460,7 +468,7 @@ def render_page() -> pd.DataFrame:
         return filtered_df
     
     # Filter data for selected team
-    team_data = filtered_df[filtered_df[team_name_col] == selected_team].copy()
+    team_data = filtered_df.take(_team_rows(filter_key, team_name_col).get(selected_team, []))
     
     if team_data.empty:
         st.warning(f"{selected_team} 팀의 데이터가 없습니다.")
@@ -468,7 +476,7 @@ def render_page() -> pd.DataFrame:
     
     # Display basic info in a container
     with st.container():
-        team_metrics = _get_team_metrics(team_data)
+        team_metrics = _all_team_metrics(filter_key, cols).loc[selected_team].to_dict()
         
         # Row 1: Basic Stats
         c1, c2, c3, c4, c5 = st.columns(5)
@@ -496,20 +504,21 @@ def render_page() -> pd.DataFrame:
     
     st.divider()
     
-    # Create two columns for Radar and Laning
+    # Create two columns for Radar and Laning, both fed by the same league aggregates
+    team_agg, league = _league_aggregates(filter_key, cols)
     col_radar, col_laning = st.columns([1, 2])
     
     with col_radar:
         st.subheader("성능 지표 레이더")
         st.caption("vs League (Normalized)")
-        radar_fig = _create_normalized_radar_chart(team_data, filtered_df, selected_team)
+        radar_fig = _create_normalized_radar_chart(team_metrics, team_agg, league, selected_team, cols)
         if radar_fig:
             st.plotly_chart(radar_fig, use_container_width=True)
             
     with col_laning:
         st.subheader("라인전 지표")
         st.caption("vs League Avg Diff Adj (abs(sum)/2*len)")
-        _create_laning_phase_charts(team_data, filtered_df)
+        _create_laning_phase_charts(team_data, league)
     
     st.divider()
     
@@ -526,5 +535,5 @@ def render_page() -> pd.DataFrame:
     return filtered_df
 
 
-filtered_teams_df = render_page()
-
+if __name__ == "__main__":
+    render_page()
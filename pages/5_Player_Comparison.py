@@ -2,136 +2,26 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
-import os
+from typing import Dict, List, Optional
 
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 import streamlit as st
-from sklearn.decomposition import PCA
-from sklearn.preprocessing import StandardScaler
-from factor_analyzer import FactorAnalyzer
-from scipy.stats import percentileofscore
 
 from components.charts import create_radar_chart
-from components.sidebar import render_sidebar_filters
 from config.colors import CHART_COLORS
-from components.data_loader import load_data
-from components.utils import apply_filters
-
-st.set_page_config(layout="wide")
-
-
-def _load_filtered_players() -> pd.DataFrame:
-    df_players, _ = load_data()
-    filters = render_sidebar_filters(df_players)
-    return apply_filters(df_players, filters)
-
-
-def _get_player_id_column(df: pd.DataFrame) -> str | None:
-    """Find the player ID column name."""
-    for col in df.columns:
-        if col.lower() in ["playerid", "playername", "participantid"]:
-            return col
-    return None
-
-
-def _load_cluster_info() -> pd.DataFrame:
-    """Load cluster definitions from csv."""
-    file_path = os.path.join("data", "val.csv")
-    if not os.path.exists(file_path):
-        st.error(f"Cluster data not found at {file_path}")
-        return pd.DataFrame()
-    
-    try:
-        df = pd.read_csv(file_path)
-        if len(df.columns) >= 2:
-            df.columns = ['variable', 'cluster_label'] + list(df.columns[2:])
-            df['cluster'] = df['cluster_label'].astype(str).str.extract(r'(\d+)').astype(float)
-            return df
-    except Exception as e:
-        st.error(f"Error loading cluster data: {e}")
-        return pd.DataFrame()
-    
-    return df
-
-
-def _calculate_factor_scores(player_name: str, position: str, full_data: pd.DataFrame) -> Dict[str, Dict[str, Any]]:
-    """Calculate Factor scores for the player based on clusters."""
-    cluster_df = _load_cluster_info()
-    if cluster_df.empty:
-        return {}
-
-    # Filter data for the same position
-    position_data = full_data[full_data['position'] == position].reset_index(drop=True).copy()
-
-    # Get player's position
-    player_row = position_data[position_data['playername'] == player_name]
-    if player_row.empty:
-        return {}
-    
-    if len(position_data) < 3:
-        return {}
-
-    # Short Cluster Names
-    cluster_names = {
-        1: '성장',
-        2: '후반',
-        3: '팀파이트',
-        4: '라인전',
-        5: '사망',
-        6: '방어',
-        7: '공격',
-        8: '전투우위'
-    }
-    
-    results = {}
-    
-    for cluster_id in range(1, 9):
-        vars_in_cluster = cluster_df[cluster_df['cluster'] == cluster_id]['variable'].tolist()
-        valid_vars = [v for v in vars_in_cluster if v in position_data.columns]
-        
-        if not valid_vars:
-            results[cluster_id] = {'name': cluster_names.get(cluster_id, str(cluster_id)), 'score': 0.0}
-            continue
-            
-        X = position_data[valid_vars].fillna(0)
-        scaler = StandardScaler()
-        X_scaled = scaler.fit_transform(X)
-        
-        scores = None
-        if X.shape[1] == 1:
-            scores = X_scaled
-        else:
-            try:
-                fa = FactorAnalyzer(n_factors=1, rotation=None)
-                fa.fit(X_scaled)
-                scores = fa.transform(X_scaled)
-            except:
-                try:
-                    pca = PCA(n_components=1)
-                    scores = pca.fit_transform(X_scaled)
-                except:
-                    scores = X_scaled.mean(axis=1).reshape(-1, 1)
-
-        if pd.Series(scores.flatten()).corr(X.sum(axis=1).reset_index(drop=True)) < 0:
-            scores = -scores
-            
-        player_score = scores[player_row.index].mean()
-        percentile = 50 + (player_score - scores.mean()) / scores.std() * 10
-        
-        # Invert for negative indicators (5: Deaths, 8: Enemy Combat Advantage)
-        # So that Higher Score = Better Performance (Low Deaths, Low Enemy Advantage)
-        if cluster_id in [5, 8]:
-            percentile = 100 - percentile
-        
-        results[cluster_id] = {
-            'name': cluster_names.get(cluster_id, str(cluster_id)),
-            'score': percentile
-        }
-        
-    return results
+from components.data_loader import sorted_unique
+from components.selection import load_selection
+from components.player_metrics import (
+    CLUSTER_SHORT_NAMES,
+    MOST_CHAMPS_COLUMNS,
+    calculate_factor_scores,
+    player_id_column,
+    player_rows,
+    players_by_position,
+)
 
 
 def _create_style_radar_chart(scores_a: Dict, scores_b: Dict, name_a: str, name_b: str) -> go.Figure:
@@ -182,27 +72,22 @@ def _create_style_radar_chart(scores_a: Dict, scores_b: Dict, name_a: str, name_
 
 def _create_diff_chart(scores_a: Dict, scores_b: Dict, name_a: str, name_b: str) -> go.Figure:
     """Create bar chart showing score differences."""
-    categories = []
-    diffs = []
+    cluster_ids = [i for i in range(1, 9) if i in scores_a]
+    categories = np.array([scores_a[i]['name'] for i in cluster_ids], dtype=object)
+    score_a = np.array([scores_a[i]['score'] for i in cluster_ids], dtype=float)
+    score_b = np.array([scores_b.get(i, {'score': 0})['score'] for i in cluster_ids], dtype=float)
+    diffs = score_a - score_b
     
-    for i in range(1, 9):
-        if i in scores_a:
-            cat = scores_a[i]['name']
-            diff = scores_a[i]['score'] - scores_b.get(i, {'score': 0})['score']
-            categories.append(cat)
-            diffs.append(diff)
-            
-    # Sort by diff
-    sorted_indices = sorted(range(len(diffs)), key=lambda k: diffs[k])
-    categories = [categories[i] for i in sorted_indices]
-    diffs = [diffs[i] for i in sorted_indices]
+    # Sort by diff (stable, so ties keep cluster order)
+    order = np.argsort(diffs, kind='stable')
+    categories, diffs = categories[order].tolist(), diffs[order]
     
-    colors = [CHART_COLORS['player_a'] if d > 0 else CHART_COLORS['player_b'] for d in diffs]
+    colors = np.where(diffs > 0, CHART_COLORS['player_a'], CHART_COLORS['player_b']).tolist()
     
     fig = go.Figure(go.Bar(
         y=categories, x=diffs, orientation='h',
         marker=dict(color=colors),
-        text=[f"{abs(d):.1f}" for d in diffs],
+        text=[f"{d:.1f}" for d in np.abs(diffs)],
         textposition='auto'
     ))
     
@@ -219,9 +104,9 @@ def _get_most_champs(df: pd.DataFrame) -> pd.DataFrame:
     if df.empty:
         return pd.DataFrame()
         
-    stats = df.groupby("champion").agg(
+    stats = df[list(MOST_CHAMPS_COLUMNS)].groupby("champion", observed=True).agg(
         gameplay=("champion", "count"),
-        win_rate=("result", lambda x: pd.to_numeric(x, errors="coerce").mean() * 100),
+        win_rate=("result", "mean"),
         kda=("KDA", "mean"),
         gd10=("golddiffat10", "mean"),
         gd15=("golddiffat15", "mean"),
@@ -231,35 +116,44 @@ def _get_most_champs(df: pd.DataFrame) -> pd.DataFrame:
         dpm=("dpm", "mean"),
         vs=("visionscore", "mean"),
     ).reset_index()
+    stats["win_rate"] *= 100
     
     return stats.sort_values("gameplay", ascending=False).head(5)
 
 
-def _get_head_to_head_stats(df_all: pd.DataFrame, player_a: str, player_b: str) -> pd.DataFrame:
+def _get_head_to_head_stats(
+    df_all: pd.DataFrame, player_a: str, player_b: str, player_id_col: str
+) -> pd.DataFrame:
     """Find games where players faced each other."""
     # Get all games for both players
-    games_a = df_all[df_all['playername'] == player_a]
-    games_b = df_all[df_all['playername'] == player_b]
+    games_a = df_all[df_all[player_id_col] == player_a]
+    games_b = df_all[df_all[player_id_col] == player_b]
     
     # Merge on gameid
     merged = pd.merge(games_a, games_b, on='gameid', suffixes=('_a', '_b'))
     
     # Filter for opposing teams
-    opponents = merged[merged['teamname_a'] != merged['teamname_b']].copy()
+    opponents = merged[merged['teamname_a'] != merged['teamname_b']]
     
     return opponents
 
 
 def render_page():
+    st.set_page_config(layout="wide")
     st.header("Player vs. Player Comparison")
     
-    filtered_df = _load_filtered_players()
+    filtered_df, filter_key = load_selection("players")
     if filtered_df.empty:
         st.warning("데이터가 없습니다.")
         return
 
-    player_id_col = 'playername'
-    unique_players = sorted(filtered_df[player_id_col].dropna().unique().tolist(), key=str)
+    player_id_col = player_id_column(filtered_df)
+    if player_id_col is None:
+        st.error("플레이어 ID 컬럼을 찾을 수 없습니다.")
+        return
+
+    unique_players = sorted_unique(filtered_df[player_id_col])
+    rows_by_player = player_rows(filter_key, player_id_col)
     
     # Layout: Player Selection
     col1, col2 = st.columns(2)
@@ -273,16 +167,16 @@ def render_page():
         st.subheader("Player B")
         if player_a:
             # Get Position of A
-            pos_a = filtered_df[filtered_df[player_id_col] == player_a]['position'].iloc[0]
+            pos_a = filtered_df['position'].iloc[rows_by_player[player_a][0]]
             st.caption(f"Player A Position: **{pos_a}**")
             
-            # Filter B candidates (same position)
-            candidates = filtered_df[
-                (filtered_df['position'] == pos_a) & 
-                (filtered_df[player_id_col] != player_a)
-            ][player_id_col].unique().tolist()
+            # Filter B candidates (same position), from the per-position lists cached per selection
+            candidates = [
+                player for player in players_by_position(filter_key, player_id_col).get(pos_a, [])
+                if player != player_a
+            ]
             
-            player_b = st.selectbox("Select Player B", sorted(candidates, key=str), key="p_b")
+            player_b = st.selectbox("Select Player B", candidates, key="p_b")
         else:
             player_b = None
 
@@ -290,13 +184,19 @@ def render_page():
         st.divider()
         
         # Data
-        df_a = filtered_df[filtered_df[player_id_col] == player_a]
-        df_b = filtered_df[filtered_df[player_id_col] == player_b]
+        df_a = filtered_df.take(rows_by_player[player_a])
+        df_b = filtered_df.take(rows_by_player[player_b])
         
         # 1. Player Style Analysis
         st.subheader("Player Style Analysis")
-        scores_a = _calculate_factor_scores(player_a, pos_a, filtered_df)
-        scores_b = _calculate_factor_scores(player_b, pos_a, filtered_df)
+        scores_a = calculate_factor_scores(
+            player_a, pos_a, filtered_df, filter_key, player_id_col,
+            names=CLUSTER_SHORT_NAMES, invert_negative=True,
+        )
+        scores_b = calculate_factor_scores(
+            player_b, pos_a, filtered_df, filter_key, player_id_col,
+            names=CLUSTER_SHORT_NAMES, invert_negative=True,
+        )
         
         if scores_a and scores_b:
             sc1, sc2 = st.columns(2)
@@ -340,7 +240,7 @@ def render_page():
         # 4. Head-to-Head
         st.subheader("상대 전적 (Head-to-Head)")
         
-        h2h_games = _get_head_to_head_stats(filtered_df, player_a, player_b)
+        h2h_games = _get_head_to_head_stats(filtered_df, player_a, player_b, player_id_col)
         
         if not h2h_games.empty:
             # Stats Diff in H2H
@@ -370,5 +270,6 @@ def render_page():
         else:
             st.info("맞대결 기록이 없습니다.")
 
-render_page()
 
+if __name__ == "__main__":
+    render_page()
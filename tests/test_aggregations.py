@@ -0,0 +1,65 @@
+import pandas as pd
+
+from components.aggregations import champion_stats
+
+
+def _frames():
+    teams = pd.DataFrame(
+        {
+            "gameid": ["G1", "G1"],
+            "result": [1, 0],
+            "pick1": ["Aatrox", "Renekton"],
+            "pick2": ["Ahri", "Orianna"],
+            "pick3": [None, None],
+            "pick4": [None, None],
+            "pick5": [None, None],
+            "ban1": ["Zed", "Yasuo"],
+            "ban2": ["Orianna", None],
+            "ban3": [None, None],
+            "ban4": [None, None],
+            "ban5": [None, None],
+        }
+    )
+    players = pd.DataFrame(
+        {
+            "gameid": ["G1"] * 4,
+            "champion": ["Aatrox", "Ahri", "Renekton", "Orianna"],
+            "position": ["top", "mid", "top", "mid"],
+            "ban1": ["Zed", "Zed", "Yasuo", "Yasuo"],
+            "ban2": ["Orianna", "Orianna", None, None],
+            "ban3": [None] * 4,
+            "ban4": [None] * 4,
+            "ban5": [None] * 4,
+        }
+    )
+    return players, teams
+
+
+def test_champion_stats_counts_bans_from_both_teams():
+    stats = champion_stats(*_frames()).set_index("champion")
+    assert stats.loc["Zed", "bans"] == 1
+    assert stats.loc["Yasuo", "bans"] == 1
+    assert stats.loc["Orianna", "picks"] == 1
+    assert stats.loc["Orianna", "bans"] == 1
+    assert stats.loc["Orianna", "p_b_rate"] == 200.0
+
+
+def test_champion_stats_ban_rate_counts_both_teams():
+    stats = champion_stats(*_frames()).set_index("champion")
+    assert stats.loc["Zed", "ban_rate"] == 100.0
+    assert stats.loc["Yasuo", "ban_rate"] == 100.0
+
+
+def test_champion_stats_win_rate_and_position():
+    stats = champion_stats(*_frames()).set_index("champion")
+    assert stats.loc["Aatrox", "win_rate"] == 100.0
+    assert stats.loc["Renekton", "loss_rate"] == 100.0
+    assert stats.loc["Aatrox", "position"] == "top"
+    assert pd.isna(stats.loc["Zed", "position"])
+
+
+def test_champion_stats_tolerates_missing_slots():
+    players, teams = _frames()
+    stats = champion_stats(players, teams.drop(columns=["pick5", "ban5"])).set_index("champion")
+    assert stats.loc["Zed", "bans"] == 1
+    assert stats["picks"].sum() == 4
@@ -35,3 +35,12 @@ def test_create_radar_chart_non_numeric_value():
     with pytest.raises(ValueError):
         create_radar_chart(stats, title="Invalid")
 
+
+
+def test_create_radar_chart_cached_figure_is_independent():
+    stats = {"KDA": 4.5, "DPM": 600}
+    first = create_radar_chart(stats, title="Cached")
+    first.update_layout(title="Mutated")
+    second = create_radar_chart(stats, title="Cached")
+    assert second.layout.title.text == "Cached"
+    assert list(second.data[0].r) == [4.5, 600]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+
+from components.data_loader import PARQUET_CACHE_VERSION, _compact_flags, _read_dataset, sorted_unique
+
+
+def _write_csv(path):
+    path.write_text(
+        ",gameid,position,champion,kills\n"
+        "0,g1,top,Aatrox,3\n"
+        "1,g1,team,,3\n"
+    )
+
+
+def test_read_dataset_writes_and_reuses_parquet_cache(tmp_path):
+    csv_path = tmp_path / "games.csv"
+    _write_csv(csv_path)
+
+    first = _read_dataset(csv_path)
+    assert csv_path.with_suffix(f".v{PARQUET_CACHE_VERSION}.parquet").exists()
+    assert list(first.columns) == ["gameid", "position", "champion", "kills"]
+
+    second = _read_dataset(csv_path)
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_read_dataset_rebuilds_corrupt_parquet_cache(tmp_path):
+    csv_path = tmp_path / "games.csv"
+    _write_csv(csv_path)
+    expected = _read_dataset(csv_path)
+
+    parquet_path = csv_path.with_suffix(f".v{PARQUET_CACHE_VERSION}.parquet")
+    parquet_path.write_bytes(b"not parquet")
+
+    pd.testing.assert_frame_equal(_read_dataset(csv_path), expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected)
+
+
+def test_sorted_unique_dispatches_on_dtype():
+    assert sorted_unique(pd.Series([3, 1, None, 2])) == [1.0, 2.0, 3.0]
+    assert sorted_unique(pd.Series(["b", "a", None, "b"])) == ["a", "b"]
+    categorical = pd.Series(pd.Categorical(["z", "x"], categories=["x", "y", "z"]))
+    assert sorted_unique(categorical) == ["x", "z"]
+
+
+def test_compact_flags_only_narrows_complete_columns():
+    df = pd.DataFrame({"result": [1.0, 0.0], "firstdragon": [1.0, np.nan], "kills": [2.0, 3.0]})
+    compacted = _compact_flags(df)
+    assert compacted["result"].dtype == np.int8
+    assert compacted["firstdragon"].dtype == np.float64
+    assert compacted["kills"].dtype == np.float64
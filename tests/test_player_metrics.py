@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from components import player_metrics
+from components.player_metrics import (
+    CLUSTER_NAMES,
+    CLUSTER_SHORT_NAMES,
+    calculate_factor_scores,
+    position_scores,
+)
+
+
+def test_position_scores_aligns_with_position_rows():
+    full_data = pd.DataFrame(
+        {
+            "position": ["top", "mid", "top", "mid", "top", "top"],
+            "assists": [1.0, 9.0, 3.0, 9.0, 5.0, 7.0],
+            "teamkills": [2.0, 0.0, 6.0, 0.0, 10.0, 14.0],
+        }
+    )
+
+    rows = full_data.groupby("position").indices
+    scores = position_scores(rows["top"], full_data)
+
+    # assists and teamkills both load on Factor 3 in data/val.csv
+    valid_vars, cluster_scores = scores[3]
+    assert valid_vars == ["assists", "teamkills"]
+    assert cluster_scores.shape == (4, 1)
+    # More stats means a higher score
+    assert np.all(np.diff(cluster_scores.ravel()) > 0)
+    assert position_scores(rows["mid"], full_data) == {}
+    assert position_scores(None, full_data) == {}
+
+
+def test_calculate_factor_scores_on_position_scale(monkeypatch):
+    full_data = pd.DataFrame(
+        {
+            "playername": ["A", "B", "A", "C", "D"],
+            "position": ["top", "mid", "top", "top", "top"],
+            "deaths": [1.0, 4.0, 3.0, 5.0, 7.0],
+        }
+    )
+    rows = full_data.groupby("position").indices
+    monkeypatch.setattr(player_metrics, "position_rows", lambda filter_key: rows)
+    monkeypatch.setattr(
+        player_metrics,
+        "compute_position_scores",
+        lambda position, filter_key: position_scores(rows.get(position), full_data),
+    )
+
+    scores = calculate_factor_scores("A", "top", full_data, (), "playername")
+    inverted = calculate_factor_scores(
+        "A", "top", full_data, (), "playername", names=CLUSTER_SHORT_NAMES, invert_negative=True
+    )
+
+    # deaths is the only Factor 5 variable in the frame; A is below the cohort mean
+    assert scores[5]["vars"] == ["deaths"]
+    assert scores[5]["name"] == CLUSTER_NAMES[5]
+    assert scores[5]["score"] < 50
+    assert inverted[5]["name"] == CLUSTER_SHORT_NAMES[5]
+    assert inverted[5]["score"] == pytest.approx(100 - scores[5]["score"])
+    assert scores[1] == {"name": CLUSTER_NAMES[1], "score": 0.0, "vars": []}
+    assert calculate_factor_scores("B", "top", full_data, (), "playername") == {}
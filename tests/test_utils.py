@@ -0,0 +1,48 @@
+import pandas as pd
+
+from components.utils import apply_filters, build_filter_index, make_filter_key
+
+
+def _sample_frame():
+    return pd.DataFrame(
+        {
+            "year": [2024, 2025, 2025, 2025],
+            "split": pd.Categorical(["Spring", "Spring", "Summer", "Summer"]),
+            "kills": [1, 2, 3, 4],
+        }
+    )
+
+
+def test_apply_filters_combines_filters():
+    filtered = apply_filters(_sample_frame(), {"year": 2025, "split": "Summer"})
+    assert filtered["kills"].tolist() == [3, 4]
+
+
+def test_apply_filters_ignores_all_and_none():
+    df = _sample_frame()
+    filtered = apply_filters(df, {"year": "All", "split": None})
+    assert len(filtered) == len(df)
+
+
+def test_apply_filters_unknown_category_returns_empty():
+    filtered = apply_filters(_sample_frame(), {"split": "Winter"})
+    assert filtered.empty
+
+
+def test_apply_filters_without_active_filters_skips_slicing():
+    df = _sample_frame()
+    assert apply_filters(df, {"year": None}) is df
+
+
+def test_apply_filters_with_index_matches_mask_path():
+    df = _sample_frame()
+    index = build_filter_index(df, ["year", "split"])
+    filters = {"year": 2025, "split": "Summer"}
+    pd.testing.assert_frame_equal(apply_filters(df, filters, index=index), apply_filters(df, filters))
+    assert apply_filters(df, {"split": "Winter"}, index=index).empty
+
+
+def test_make_filter_key_ignores_insertion_order():
+    key = make_filter_key({"split": "Spring", "year": 2025})
+    assert key == make_filter_key({"year": 2025, "split": "Spring"})
+    assert dict(key) == {"split": "Spring", "year": 2025}